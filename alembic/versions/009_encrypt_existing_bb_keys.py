@@ -5,25 +5,108 @@ Revises: 008
 Create Date: 2026-02-10
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from alembic import op
 from cryptography.fernet import Fernet
-from sqlalchemy import text
+from sqlalchemy import Integer, String, bindparam, text
+
+from app.utils.ddl import drop_indexes_for_bulk_update, recreate_indexes
 
 revision = "009"
 down_revision = "008"
 branch_labels = None
 depends_on = None
 
+# Rows per SELECT page and per executemany round-trip
+BATCH_SIZE = 1000
+
+# Fernet tokens start with gAAAAA; compare as binary so the prefix match
+# stays case-sensitive
+PLAIN_KEYS = "CAST(bb_key AS BINARY) NOT LIKE 'gAAAAA%'"
+ENCRYPTED_KEYS = "CAST(bb_key AS BINARY) LIKE 'gAAAAA%'"
+
+# Statements are built once so every page reuses the same compiled form.
+# ids are still CHAR(32) hex strings at this revision.
+UPDATE_KEY = text("UPDATE users SET bb_key = :key WHERE id = :id").bindparams(
+    bindparam("key", type_=String),
+    bindparam("id", type_=String),
+)
+
+
+def _page_queries(predicate: str):
+    base = f"SELECT id, bb_key FROM users WHERE bb_key IS NOT NULL AND {predicate}"
+    first_page = text(f"{base} ORDER BY id LIMIT :limit").bindparams(
+        bindparam("limit", type_=Integer),
+    )
+    next_page = text(f"{base} AND id > :last_id ORDER BY id LIMIT :limit").bindparams(
+        bindparam("last_id", type_=String),
+        bindparam("limit", type_=Integer),
+    )
+    return first_page, next_page
+
 
-def _encrypt(value: str, fernet: Fernet) -> str:
-    return fernet.encrypt(value.encode()).decode()
+PLAIN_KEY_PAGES = _page_queries(PLAIN_KEYS)
+ENCRYPTED_KEY_PAGES = _page_queries(ENCRYPTED_KEYS)
+
+
+def _encrypt(value: str, fernet: Fernet, current_time: int) -> str:
+    return fernet.encrypt_at_time(value.encode(), current_time).decode()
 
 
 def _decrypt(value: str, fernet: Fernet) -> str:
     return fernet.decrypt(value.encode()).decode()
 
 
+def _iter_batches(conn, pages):
+    """Yield (id, bb_key) rows from a (first_page, next_page) pair, one page at a time.
+
+    Keyset pagination keeps memory bounded to one page without holding a
+    server-side cursor open while the UPDATEs run on the same connection.
+    """
+    first_page, next_page = pages
+    rows = conn.execute(first_page, {"limit": BATCH_SIZE}).fetchall()
+    while rows:
+        yield rows
+        if len(rows) < BATCH_SIZE:
+            return
+        rows = conn.execute(next_page, {"last_id": rows[-1][0], "limit": BATCH_SIZE}).fetchall()
+
+
+def _update(conn, batch: list[dict]) -> None:
+    conn.execute(UPDATE_KEY, batch)
+
+
+def _commit_page() -> None:
+    # autocommit_block() commits the open migration transaction on entry and
+    # starts a fresh one on exit, so each page is committed on its own
+    with op.get_context().autocommit_block():
+        pass
+
+
+def _convert(conn, pages, transform) -> None:
+    """Apply transform to every matching bb_key, one page per executemany.
+
+    Fernet instances are thread-safe and cryptography releases the GIL in
+    OpenSSL, so each page is transformed on a thread pool. bb_key is not
+    indexed today; any index added on it later is dropped for the rewrite
+    and rebuilt once at the end.
+
+    Each page is committed separately so undo log and replication lag stay
+    bounded on large tables. An interrupted run is safe to repeat: the page
+    queries only select rows that still need converting.
+    """
+    indexes = drop_indexes_for_bulk_update("users", ["bb_key"])
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for rows in _iter_batches(conn, pages):
+            values = executor.map(transform, [bb_key for _, bb_key in rows])
+            _update(conn, [{"key": value, "id": user_id} for (user_id, _), value in zip(rows, values)])
+            _commit_page()
+    recreate_indexes("users", indexes)
+
+
 def upgrade() -> None:
     encryption_key = os.getenv("ENCRYPTION_KEY", "")
     if not encryption_key:
@@ -32,20 +115,9 @@ def upgrade() -> None:
     fernet = Fernet(encryption_key.encode())
     conn = op.get_bind()
 
-    rows = conn.execute(
-        text("SELECT id, bb_key FROM users WHERE bb_key IS NOT NULL")
-    ).fetchall()
-
-    for user_id, bb_key in rows:
-        # Skip already-encrypted values (Fernet tokens start with gAAAAA)
-        if bb_key.startswith("gAAAAA"):
-            continue
-
-        encrypted_key = _encrypt(bb_key, fernet)
-        conn.execute(
-            text("UPDATE users SET bb_key = :key WHERE id = :id"),
-            {"key": encrypted_key, "id": user_id},
-        )
+    # Stamp every token with the migration start time instead of reading the
+    # clock per row
+    _convert(conn, PLAIN_KEY_PAGES, partial(_encrypt, fernet=fernet, current_time=int(time.time())))
 
 
 def downgrade() -> None:
@@ -56,16 +128,4 @@ def downgrade() -> None:
     fernet = Fernet(encryption_key.encode())
     conn = op.get_bind()
 
-    rows = conn.execute(
-        text("SELECT id, bb_key FROM users WHERE bb_key IS NOT NULL")
-    ).fetchall()
-
-    for user_id, bb_key in rows:
-        if not bb_key.startswith("gAAAAA"):
-            continue
-
-        decrypted_key = _decrypt(bb_key, fernet)
-        conn.execute(
-            text("UPDATE users SET bb_key = :key WHERE id = :id"),
-            {"key": decrypted_key, "id": user_id},
-        )
\ No newline at end of file
+    _convert(conn, ENCRYPTED_KEY_PAGES, partial(_decrypt, fernet=fernet))
@@ -0,0 +1,84 @@
+"""Store UUID primary and foreign keys as BINARY(16)
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-03-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+# table -> {uuid column: nullable}
+UUID_COLUMNS = {
+    "users": {"id": False},
+    "team": {"id": False, "coach_id": False},
+    "player": {"id": False, "current_team_id": True},
+    "player_share": {"id": False, "player_id": False, "owner_id": False, "recipient_id": False},
+    "player_snapshot": {"id": False, "player_id": False, "team_id": False},
+    "player_thread": {"id": False, "player_id": False, "owner_id": False, "participant_id": False},
+    "player_message": {"id": False, "thread_id": False, "sender_id": False},
+    "player_training_plan": {"id": False, "player_id": False},
+    "user_thread": {"id": False, "user_a_id": False, "user_b_id": False},
+    "user_message": {"id": False, "thread_id": False, "sender_id": False},
+}
+
+
+def _drop_foreign_keys() -> list[tuple[str, dict]]:
+    """Drop every FK between the UUID tables and return them for re-creation."""
+    inspector = sa.inspect(op.get_bind())
+    dropped = []
+    for table in UUID_COLUMNS:
+        for fk in inspector.get_foreign_keys(table):
+            op.drop_constraint(fk["name"], table, type_="foreignkey")
+            dropped.append((table, fk))
+    return dropped
+
+
+def _create_foreign_keys(foreign_keys: list[tuple[str, dict]]) -> None:
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            ondelete=fk.get("options", {}).get("ondelete"),
+        )
+
+
+def _modify(table: str, columns: dict, column_type: str) -> None:
+    clauses = ", ".join(
+        f"MODIFY {name} {column_type} {'NULL' if nullable else 'NOT NULL'}"
+        for name, nullable in columns.items()
+    )
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    foreign_keys = _drop_foreign_keys()
+
+    for table, columns in UUID_COLUMNS.items():
+        # Switch to a binary string first so the hex text survives, then pack it
+        _modify(table, columns, "VARBINARY(36)")
+        assignments = ", ".join(f"{name} = UNHEX(REPLACE({name}, '-', ''))" for name in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")
+        _modify(table, columns, "BINARY(16)")
+
+    _create_foreign_keys(foreign_keys)
+
+
+def downgrade() -> None:
+    foreign_keys = _drop_foreign_keys()
+
+    for table, columns in UUID_COLUMNS.items():
+        _modify(table, columns, "VARBINARY(32)")
+        assignments = ", ".join(f"{name} = LOWER(HEX({name}))" for name in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")
+        _modify(table, columns, "CHAR(32)")
+
+    _create_foreign_keys(foreign_keys)
@@ -0,0 +1,60 @@
+"""Replace single-column thread indexes with composite inbox indexes
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-03-10
+
+"""
+from alembic import op
+
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # New indexes are created before the old ones are dropped: MySQL needs an
+    # index led by each FK column at all times.
+    op.create_index(
+        "ix_player_thread_owner_active_updated",
+        "player_thread",
+        ["owner_id", "is_active", "updated_at"],
+    )
+    op.create_index(
+        "ix_player_thread_participant_active_updated",
+        "player_thread",
+        ["participant_id", "is_active", "updated_at"],
+    )
+    op.drop_index("ix_player_thread_owner_id", table_name="player_thread")
+    op.drop_index("ix_player_thread_participant_id", table_name="player_thread")
+
+    op.create_index(
+        "ix_user_thread_user_a_active_updated",
+        "user_thread",
+        ["user_a_id", "is_active", "updated_at"],
+    )
+    op.create_index(
+        "ix_user_thread_user_b_active_updated",
+        "user_thread",
+        ["user_b_id", "is_active", "updated_at"],
+    )
+
+    op.create_index("ix_player_message_thread_created", "player_message", ["thread_id", "created_at"])
+    op.drop_index("ix_player_message_thread_id", table_name="player_message")
+
+
+def downgrade() -> None:
+    op.create_index("ix_player_message_thread_id", "player_message", ["thread_id"])
+    op.drop_index("ix_player_message_thread_created", table_name="player_message")
+
+    # MySQL dropped the implicit user_b_id FK index in favour of the composite
+    # one, so restore it first; user_a_id stays covered by unique_user_thread
+    op.create_index("ix_user_thread_user_b_id", "user_thread", ["user_b_id"])
+    op.drop_index("ix_user_thread_user_b_active_updated", table_name="user_thread")
+    op.drop_index("ix_user_thread_user_a_active_updated", table_name="user_thread")
+
+    op.create_index("ix_player_thread_participant_id", "player_thread", ["participant_id"])
+    op.create_index("ix_player_thread_owner_id", "player_thread", ["owner_id"])
+    op.drop_index("ix_player_thread_participant_active_updated", table_name="player_thread")
+    op.drop_index("ix_player_thread_owner_active_updated", table_name="player_thread")
@@ -0,0 +1,26 @@
+"""Add index for the unread reminder user scan
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-03-10
+
+"""
+from alembic import op
+
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # MySQL has no partial indexes, so the selective flags lead the key
+    op.create_index(
+        "ix_users_unread_reminder_scan",
+        "users",
+        ["unread_reminder_enabled", "email_verified", "last_unread_reminder_sent_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_unread_reminder_scan", table_name="users")
@@ -0,0 +1,33 @@
+"""Let the database fill in supporter and auto_sync_enabled defaults
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-03-10
+
+"""
+from alembic import op
+
+from app.utils.ddl import alter_table_online
+
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Changing a column default is metadata-only, so this runs INSTANT on MySQL
+    alter_table_online(
+        "users",
+        "ALTER COLUMN supporter SET DEFAULT FALSE, ALTER COLUMN auto_sync_enabled SET DEFAULT TRUE",
+    )
+    # NULL auto_sync_enabled rows are left alone: the sync job treats them as
+    # opted out, and backfilling TRUE would silently opt those users in
+    op.execute("UPDATE users SET supporter = FALSE WHERE supporter IS NULL")
+
+
+def downgrade() -> None:
+    alter_table_online(
+        "users",
+        "ALTER COLUMN supporter DROP DEFAULT, ALTER COLUMN auto_sync_enabled DROP DEFAULT",
+    )
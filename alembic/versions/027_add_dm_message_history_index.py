@@ -0,0 +1,26 @@
+"""Add composite index for DM message history
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-03-11
+
+"""
+from alembic import op
+
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leads with the thread_id FK column, so MySQL drops the implicit FK index
+    # it created for that column instead of keeping two. Share lookups by
+    # (player_id, recipient_id) are already served by unique_player_share.
+    op.create_index("ix_user_message_thread_created", "user_message", ["thread_id", "created_at"])
+
+
+def downgrade() -> None:
+    # Keep an index on the FK column before dropping the composite one
+    op.create_index("ix_user_message_thread_id", "user_message", ["thread_id"])
+    op.drop_index("ix_user_message_thread_created", table_name="user_message")
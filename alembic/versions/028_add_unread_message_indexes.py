@@ -0,0 +1,41 @@
+"""Add unread-message and received-share indexes
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-03-12
+
+"""
+from alembic import op
+
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Unread counts and mark-as-read filter on thread_id, read_at IS NULL and
+    # sender_id. MySQL has no partial indexes, so read_at follows thread_id in
+    # the key and sender_id rides along.
+    op.create_index(
+        "ix_user_message_thread_unread",
+        "user_message",
+        ["thread_id", "read_at", "sender_id"],
+    )
+    op.create_index(
+        "ix_player_message_thread_unread",
+        "player_message",
+        ["thread_id", "read_at", "sender_id"],
+    )
+
+    # Shares received by a user; replaces the implicit recipient_id FK index
+    op.create_index("ix_player_share_recipient_player", "player_share", ["recipient_id", "player_id"])
+
+
+def downgrade() -> None:
+    # Keep an index led by recipient_id for its FK
+    op.create_index("ix_player_share_recipient_id", "player_share", ["recipient_id"])
+    op.drop_index("ix_player_share_recipient_player", table_name="player_share")
+
+    op.drop_index("ix_player_message_thread_unread", table_name="player_message")
+    op.drop_index("ix_user_message_thread_unread", table_name="user_message")
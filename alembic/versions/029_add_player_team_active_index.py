@@ -0,0 +1,26 @@
+"""Add composite index for active players by team
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-03-12
+
+"""
+from alembic import op
+
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rosters, share-entire-team and snapshot runs all filter on
+    # (current_team_id, active). The index leads with the FK column, so MySQL
+    # drops its implicit current_team_id FK index in favour of this one.
+    op.create_index("ix_player_team_active", "player", ["current_team_id", "active"])
+
+
+def downgrade() -> None:
+    # Keep an index led by current_team_id for its FK
+    op.create_index("ix_player_current_team_id", "player", ["current_team_id"])
+    op.drop_index("ix_player_team_active", table_name="player")
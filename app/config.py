@@ -5,6 +5,11 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     database_url: str
+    sql_echo: bool = False  # Log every SQL statement (debugging only)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800  # Seconds; keep below MySQL wait_timeout
+    strict_loading: bool = False  # Raise on any relationship load a query didn't plan for (dev/CI)
 
     # BuzzerBeater API
     bb_api_url: str = "https://bbapi.buzzerbeater.com"
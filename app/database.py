@@ -1,27 +1,33 @@
+import re
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, raiseload
 from app.config import get_settings
 
 settings = get_settings()
 
-# Convert Railway's MySQL URL to aiomysql format
-database_url = settings.database_url
-if database_url.startswith("mysql://"):
-    database_url = "mysql+aiomysql://" + database_url[8:]
-elif not database_url.startswith("mysql+aiomysql://"):
-    # Handle any other format
-    database_url = database_url.replace("mysql+mysqldb://", "mysql+aiomysql://")
-    database_url = database_url.replace("mysql+pymysql://", "mysql+aiomysql://")
+# Convert Railway's MySQL URL (or a sync-driver URL) to aiomysql format
+_SYNC_MYSQL_URL = re.compile(r"^mysql(\+(mysqldb|pymysql))?://")
+database_url = _SYNC_MYSQL_URL.sub("mysql+aiomysql://", settings.database_url, count=1)
 
 # Create engine - works with both MySQL and PostgreSQL
 engine = create_async_engine(
     database_url,
-    echo=True,
+    echo=settings.sql_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,  # Retire connections before MySQL drops them
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
     pool_pre_ping=True,  # Reconnect on stale connections
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Appended to the options of queries that eager-load everything they render.
+# With strict_loading on, touching any other relationship raises, even when
+# raise_on_sql would let an identity-map hit through.
+STRICT_LOADING = (raiseload("*"),) if settings.strict_loading else ()
+
 
 class Base(DeclarativeBase):
     pass
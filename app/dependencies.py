@@ -1,7 +1,8 @@
 from fastapi import Depends, HTTPException, status, Request
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import defer
 
 from app.database import get_db
 from app.config import get_settings
@@ -10,12 +11,19 @@ from app.models.user import User
 settings = get_settings()
 TOKEN_COOKIE_NAME = "bb_session"
 
+# JWT settings resolved once instead of on every encode/decode
+SIGNING_KEY = settings.secret_key.encode()
+JWT_ALGORITHM = settings.algorithm
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+ACCESS_TOKEN_TTL = settings.access_token_expire_minutes * 60  # seconds
+
+
+def _decode_session_token(request: Request) -> dict:
+    """Decode the session cookie once per request and cache it on request.state"""
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is not None:
+        return payload
 
-async def get_current_user(
-    request: Request,
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from session cookie"""
     token = request.cookies.get(TOKEN_COOKIE_NAME)
     if not token:
         raise HTTPException(status_code=403, detail="Not authenticated")
@@ -23,16 +31,23 @@ async def get_current_user(
     try:
         payload = jwt.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
+            SIGNING_KEY,
+            algorithms=JWT_ALGORITHMS
         )
-        login_name: str = payload.get("sub")
-        if login_name is None:
-            raise HTTPException(status_code=403, detail="Invalid token")
-    except JWTError:
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=403, detail="Invalid token")
+
+    request.state.jwt_payload = payload
+    return payload
+
+
+async def _load_current_user(request: Request, db: AsyncSession, *options) -> User:
+    payload = _decode_session_token(request)
+    login_name: str = payload.get("sub")
+    if login_name is None:
         raise HTTPException(status_code=403, detail="Invalid token")
 
-    stmt = select(User).where(User.login_name == login_name)
+    stmt = select(User).options(*options).where(User.login_name == login_name)
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
@@ -42,21 +57,30 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user from session cookie.
+
+    bb_key is not loaded (it is wide and decrypted on load); routes that call
+    the BB API should depend on get_current_user_with_bb_key instead.
+    """
+    return await _load_current_user(request, db, defer(User.bb_key, raiseload=True))
+
+
+async def get_current_user_with_bb_key(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user including the decrypted BB API key"""
+    return await _load_current_user(request, db)
+
+
 async def get_current_team_id(request: Request) -> int:
     """Get current team ID from session cookie"""
-    token = request.cookies.get(TOKEN_COOKIE_NAME)
-    if not token:
-        raise HTTPException(status_code=403, detail="Not authenticated")
-
-    try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
-        )
-        team_id = payload.get("team_id")
-        if team_id is None:
-            raise HTTPException(status_code=400, detail="No team selected")
-        return team_id
-    except JWTError:
-        raise HTTPException(status_code=403, detail="Invalid token")
+    payload = _decode_session_token(request)
+    team_id = payload.get("team_id")
+    if team_id is None:
+        raise HTTPException(status_code=400, detail="No team selected")
+    return team_id
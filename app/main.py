@@ -1,9 +1,15 @@
+import asyncio
+from typing import Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
 from app.config import get_settings
 from app.routers import auth, players, plans, shares, teams, user, team, threads, dm, health, seasons, admin, nt
 from app.scheduler import start_scheduler, stop_scheduler
+from app.services.bb_api import close_transport
 
 settings = get_settings()
 
@@ -17,16 +23,48 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     stop_scheduler()
+    await close_transport()
 
 
 app = FastAPI(
     title="BuzzerBeater Manager API",
     description="Backend API for BuzzerBeater Manager application",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# Server-Sent Events streams; never compressed
+EVENT_STREAM_PATHS = {"/api/v1/dm/events"}
+
+
+class EventStreamAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes Server-Sent Events through untouched.
+
+    Starlette's gzip responder never flushes the compressor between chunks, so
+    events and heartbeats would sit in the zlib buffer instead of reaching the
+    client.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and _is_event_stream(scope):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+def _is_event_stream(scope) -> bool:
+    if scope["path"] in EVENT_STREAM_PATHS:
+        return True
+    accept = Headers(scope=scope).get("accept", "")
+    return "text/event-stream" in accept
+
+
+# Compress larger JSON payloads (player lists, snapshot history); small
+# responses like /health and event streams stay uncompressed
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1000, compresslevel=5)
+
+# CORS middleware (added last so it wraps GZip and sees every response)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -58,11 +96,24 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Only one manual roster sync at a time; parallel runs just fight over the pool
+_sync_lock = asyncio.Lock()
+_sync_task: Optional[asyncio.Task] = None
+
+
+async def _guarded_sync():
+    from app.scheduler import sync_all_rosters
+    async with _sync_lock:
+        await sync_all_rosters()
+
+
 @app.get("/api/v1/admin/sync-all-rosters")
 async def trigger_roster_sync():
     """Manually trigger roster sync for all users (admin endpoint)."""
-    from app.scheduler import sync_all_rosters
-    import asyncio
-    # Run in background so we don't timeout
-    asyncio.create_task(sync_all_rosters())
+    global _sync_task
+    # The new task only takes the lock once it first runs, so check it as well
+    if _sync_lock.locked() or (_sync_task is not None and not _sync_task.done()):
+        return {"success": False, "message": "Sync already in progress"}
+    # Run in background so we don't timeout; keep a reference so the task isn't collected
+    _sync_task = asyncio.create_task(_guarded_sync())
     return {"success": True, "message": "Roster sync started in background"}
@@ -19,8 +19,8 @@ class MatchBoxscore(Base):
     attendance_courtside = Column(Integer, nullable=True)
     attendance_luxury = Column(Integer, nullable=True)
 
-    teams = relationship("MatchTeamBoxscore", back_populates="match", cascade="all, delete-orphan")
-    players = relationship("MatchPlayerBoxscore", back_populates="match", cascade="all, delete-orphan")
+    teams = relationship("MatchTeamBoxscore", back_populates="match", cascade="all, delete-orphan", lazy="raise_on_sql")
+    players = relationship("MatchPlayerBoxscore", back_populates="match", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class MatchTeamBoxscore(Base):
@@ -76,7 +76,7 @@ class MatchTeamBoxscore(Base):
     totals_pf = Column(Integer, nullable=True)
     totals_pts = Column(Integer, nullable=True)
 
-    match = relationship("MatchBoxscore", back_populates="teams")
+    match = relationship("MatchBoxscore", back_populates="teams", lazy="raise_on_sql")
 
 
 class MatchPlayerBoxscore(Base):
@@ -113,4 +113,4 @@ class MatchPlayerBoxscore(Base):
     pts = Column(Integer, nullable=True)
     rating = Column(Float, nullable=True)
 
-    match = relationship("MatchBoxscore", back_populates="players")
+    match = relationship("MatchBoxscore", back_populates="players", lazy="raise_on_sql")
@@ -16,8 +16,8 @@ class NTMatchBoxscore(Base):
     attendance_lower_tier = Column(Integer, nullable=True)
     attendance_courtside = Column(Integer, nullable=True)
     attendance_luxury = Column(Integer, nullable=True)
-    teams = relationship("NTMatchTeamBoxscore", back_populates="match", cascade="all, delete-orphan")
-    players = relationship("NTMatchPlayerBoxscore", back_populates="match", cascade="all, delete-orphan")
+    teams = relationship("NTMatchTeamBoxscore", back_populates="match", cascade="all, delete-orphan", lazy="raise_on_sql")
+    players = relationship("NTMatchPlayerBoxscore", back_populates="match", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 class NTMatchTeamBoxscore(Base):
     __tablename__ = "nt_match_team_boxscore"
@@ -65,7 +65,7 @@ class NTMatchTeamBoxscore(Base):
     totals_blk = Column(Integer, nullable=True)
     totals_pf = Column(Integer, nullable=True)
     totals_pts = Column(Integer, nullable=True)
-    match = relationship("NTMatchBoxscore", back_populates="teams")
+    match = relationship("NTMatchBoxscore", back_populates="teams", lazy="raise_on_sql")
 
 class NTMatchPlayerBoxscore(Base):
     __tablename__ = "nt_match_player_boxscore"
@@ -97,4 +97,4 @@ class NTMatchPlayerBoxscore(Base):
     pf = Column(Integer, nullable=True)
     pts = Column(Integer, nullable=True)
     rating = Column(Float, nullable=True)
-    match = relationship("NTMatchBoxscore", back_populates="players")
+    match = relationship("NTMatchBoxscore", back_populates="players", lazy="raise_on_sql")
@@ -1,13 +1,14 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Uuid
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class Player(Base):
     __tablename__ = "player"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     player_id = Column(Integer, unique=True, nullable=False, index=True)  # BuzzerBeater player ID
 
     # Basic info
@@ -39,10 +40,11 @@ class Player(Base):
     experience = Column(Integer, nullable=True)
 
     # Foreign keys
-    current_team_id = Column(Uuid, ForeignKey("team.id"), nullable=True)
+    current_team_id = Column(BinaryUuid, ForeignKey("team.id"), nullable=True)
 
     # Relationships
-    current_team = relationship("Team", back_populates="players")
-    shares = relationship("PlayerShare", back_populates="player")
-    threads = relationship("PlayerThread", back_populates="player")
-    training_plan = relationship("PlayerTrainingPlan", back_populates="player", uselist=False)
+    current_team = relationship("Team", back_populates="players", lazy="raise_on_sql")
+    shares = relationship("PlayerShare", back_populates="player", lazy="raise_on_sql")
+    threads = relationship("PlayerThread", back_populates="player", lazy="raise_on_sql")
+    training_plan = relationship("PlayerTrainingPlan", back_populates="player", uselist=False, lazy="raise_on_sql")
+    snapshots = relationship("PlayerSnapshot", back_populates="player", order_by="[PlayerSnapshot.year, PlayerSnapshot.week_of_year]", lazy="raise_on_sql")
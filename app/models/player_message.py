@@ -1,23 +1,24 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Text, Uuid, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Text, Boolean
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from datetime import datetime
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class PlayerMessage(Base):
     """Message in a player thread."""
     __tablename__ = "player_message"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     content = Column(Text, nullable=False)
     read_at = Column(DateTime, nullable=True, default=None)
 
     # Foreign keys
-    thread_id = Column(Uuid, ForeignKey("player_thread.id", ondelete="CASCADE"), nullable=False)
-    sender_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    thread_id = Column(BinaryUuid, ForeignKey("player_thread.id", ondelete="CASCADE"), nullable=False)
+    sender_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
 
     # Relationships
-    thread = relationship("PlayerThread", back_populates="messages")
-    sender = relationship("User", back_populates="player_messages")
+    thread = relationship("PlayerThread", back_populates="messages", lazy="raise_on_sql")
+    sender = relationship("User", back_populates="player_messages", lazy="raise_on_sql")
@@ -1,20 +1,21 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, UniqueConstraint, Uuid, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, UniqueConstraint, Text
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from datetime import datetime
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class PlayerShare(Base):
     __tablename__ = "player_share"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Foreign keys
-    player_id = Column(Uuid, ForeignKey("player.id", ondelete="CASCADE"), nullable=False)
-    owner_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
-    recipient_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    player_id = Column(BinaryUuid, ForeignKey("player.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
+    recipient_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
     share_plan = Column(Boolean, default=False, nullable=False)
     message = Column(Text, nullable=True)  # Optional message when sharing
 
@@ -24,6 +25,6 @@ class PlayerShare(Base):
     )
 
     # Relationships
-    player = relationship("Player", back_populates="shares")
-    owner = relationship("User", foreign_keys=[owner_id], back_populates="shares_sent")
-    recipient = relationship("User", foreign_keys=[recipient_id], back_populates="shares_received")
+    player = relationship("Player", back_populates="shares", lazy="raise_on_sql")
+    owner = relationship("User", foreign_keys=[owner_id], back_populates="shares_sent", lazy="raise_on_sql")
+    recipient = relationship("User", foreign_keys=[recipient_id], back_populates="shares_received", lazy="raise_on_sql")
@@ -1,17 +1,18 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Uuid, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class PlayerSnapshot(Base):
     """Weekly snapshot of player skills - stores historical data per week."""
     __tablename__ = "player_snapshot"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
 
     # Reference to player
-    player_id = Column(Uuid, ForeignKey("player.id"), nullable=False)
+    player_id = Column(BinaryUuid, ForeignKey("player.id"), nullable=False)
     bb_player_id = Column(Integer, nullable=False)  # BuzzerBeater player ID
 
     # Week info
@@ -19,7 +20,7 @@ class PlayerSnapshot(Base):
     week_of_year = Column(Integer, nullable=False)
 
     # Team at time of snapshot
-    team_id = Column(Uuid, ForeignKey("team.id"), nullable=False)
+    team_id = Column(BinaryUuid, ForeignKey("team.id"), nullable=False)
 
     # Basic info at time of snapshot
     name = Column(String(100), nullable=False)
@@ -49,8 +50,8 @@ class PlayerSnapshot(Base):
     experience = Column(Integer, nullable=True)
 
     # Relationships
-    player = relationship("Player", backref="snapshots")
-    team = relationship("Team")
+    player = relationship("Player", back_populates="snapshots", lazy="raise_on_sql")
+    team = relationship("Team", lazy="raise_on_sql")
 
     # Ensure one snapshot per player per week
     __table_args__ = (
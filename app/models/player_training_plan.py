@@ -1,20 +1,21 @@
 """Training plan for a player: target skills at end of training."""
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text, Uuid
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from datetime import datetime
 
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class PlayerTrainingPlan(Base):
     __tablename__ = "player_training_plan"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    player_id = Column(Uuid, ForeignKey("player.id", ondelete="CASCADE"), nullable=False, unique=True)
+    player_id = Column(BinaryUuid, ForeignKey("player.id", ondelete="CASCADE"), nullable=False, unique=True)
 
     # Target skills (1–20). Null = no target for that skill.
     jump_shot = Column(Integer, nullable=True)
@@ -32,4 +33,4 @@ class PlayerTrainingPlan(Base):
     experience = Column(Integer, nullable=True)
     notes = Column(Text, nullable=True)
 
-    player = relationship("Player", back_populates="training_plan")
+    player = relationship("Player", back_populates="training_plan", lazy="raise_on_sql")
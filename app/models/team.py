@@ -1,9 +1,10 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Uuid
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 import enum
 from datetime import datetime
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class TeamType(str, enum.Enum):
@@ -14,7 +15,7 @@ class TeamType(str, enum.Enum):
 class Team(Base):
     __tablename__ = "team"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     team_id = Column(Integer, unique=True, nullable=False, index=True)  # BuzzerBeater team ID
     name = Column(String(100), nullable=False)
     short_name = Column(String(20), nullable=False)
@@ -35,8 +36,8 @@ class Team(Base):
     rival_name = Column(String(100), nullable=True)
 
     # Foreign keys
-    coach_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    coach_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
 
     # Relationships
-    coach = relationship("User", back_populates="teams")
-    players = relationship("Player", back_populates="current_team")
+    coach = relationship("User", back_populates="teams", lazy="raise_on_sql")
+    players = relationship("Player", back_populates="current_team", lazy="raise_on_sql")
@@ -1,20 +1,21 @@
-from sqlalchemy import Column, String, Boolean, Uuid, Integer, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, false, true
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 from app.utils.crypto import EncryptedString
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     login_name = Column(String(100), unique=True, nullable=False, index=True)  # Private, for login
     username = Column(String(100), nullable=True, index=True)  # Public, visible to others
     bb_key = Column(EncryptedString(512), nullable=True)  # BuzzerBeater API key (encrypted at rest)
     name = Column(String(100), nullable=True)
-    supporter = Column(Boolean, default=False)
-    auto_sync_enabled = Column(Boolean, default=True)  # Enable automatic weekly roster sync
+    supporter = Column(Boolean, default=False, server_default=false())
+    auto_sync_enabled = Column(Boolean, default=True, server_default=true())  # Enable automatic weekly roster sync
     email = Column(String(255), nullable=True)
     email_verified = Column(Boolean, default=False)
     unread_reminder_enabled = Column(Boolean, default=False)
@@ -22,13 +23,13 @@ class User(Base):
     last_unread_reminder_sent_at = Column(DateTime, nullable=True)
 
     # Relationships
-    teams = relationship("Team", back_populates="coach")
-    shares_sent = relationship("PlayerShare", foreign_keys="PlayerShare.owner_id", back_populates="owner")
-    shares_received = relationship("PlayerShare", foreign_keys="PlayerShare.recipient_id", back_populates="recipient")
-    threads_as_owner = relationship("PlayerThread", foreign_keys="PlayerThread.owner_id", back_populates="owner")
-    threads_as_participant = relationship("PlayerThread", foreign_keys="PlayerThread.participant_id", back_populates="participant")
-    player_messages = relationship("PlayerMessage", back_populates="sender")
+    teams = relationship("Team", back_populates="coach", lazy="raise_on_sql")
+    shares_sent = relationship("PlayerShare", foreign_keys="PlayerShare.owner_id", back_populates="owner", lazy="raise_on_sql")
+    shares_received = relationship("PlayerShare", foreign_keys="PlayerShare.recipient_id", back_populates="recipient", lazy="raise_on_sql")
+    threads_as_owner = relationship("PlayerThread", foreign_keys="PlayerThread.owner_id", back_populates="owner", lazy="raise_on_sql")
+    threads_as_participant = relationship("PlayerThread", foreign_keys="PlayerThread.participant_id", back_populates="participant", lazy="raise_on_sql")
+    player_messages = relationship("PlayerMessage", back_populates="sender", lazy="raise_on_sql")
     # Direct messages
-    dm_threads_as_a = relationship("UserThread", foreign_keys="UserThread.user_a_id", back_populates="user_a")
-    dm_threads_as_b = relationship("UserThread", foreign_keys="UserThread.user_b_id", back_populates="user_b")
-    dm_messages = relationship("UserMessage", back_populates="sender")
+    dm_threads_as_a = relationship("UserThread", foreign_keys="UserThread.user_a_id", back_populates="user_a", lazy="raise_on_sql")
+    dm_threads_as_b = relationship("UserThread", foreign_keys="UserThread.user_b_id", back_populates="user_b", lazy="raise_on_sql")
+    dm_messages = relationship("UserMessage", back_populates="sender", lazy="raise_on_sql")
@@ -1,23 +1,24 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Text, Uuid
+from sqlalchemy import Column, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
-import uuid
+from uuid6 import uuid7
 from datetime import datetime
 from app.database import Base
+from app.utils.binary_uuid import BinaryUuid
 
 
 class UserMessage(Base):
     """Message in a direct user-to-user thread."""
     __tablename__ = "user_message"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     content = Column(Text, nullable=False)
     read_at = Column(DateTime, nullable=True, default=None)
 
     # Foreign keys
-    thread_id = Column(Uuid, ForeignKey("user_thread.id", ondelete="CASCADE"), nullable=False)
-    sender_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    thread_id = Column(BinaryUuid, ForeignKey("user_thread.id", ondelete="CASCADE"), nullable=False)
+    sender_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
 
     # Relationships
-    thread = relationship("UserThread", back_populates="messages")
-    sender = relationship("User", back_populates="dm_messages")
+    thread = relationship("UserThread", back_populates="messages", lazy="raise_on_sql")
+    sender = relationship("User", back_populates="dm_messages", lazy="raise_on_sql")
@@ -1,27 +1,43 @@
-from sqlalchemy import Column, DateTime, ForeignKey, UniqueConstraint, Uuid, Boolean
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy import Column, DateTime, ForeignKey, UniqueConstraint, Boolean, select
+from sqlalchemy.orm import column_property, relationship
+from uuid6 import uuid7
 from datetime import datetime
 from app.database import Base
+from app.models.user_message import UserMessage
+from app.utils.binary_uuid import BinaryUuid
 
 
 class UserThread(Base):
     """Direct message thread between two users."""
     __tablename__ = "user_thread"
 
-    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    id = Column(BinaryUuid, primary_key=True, default=uuid7)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
 
     # Participants (unordered pair stored as user_a_id < user_b_id by convention)
-    user_a_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
-    user_b_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    user_a_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
+    user_b_id = Column(BinaryUuid, ForeignKey("users.id"), nullable=False)
 
     __table_args__ = (
         UniqueConstraint("user_a_id", "user_b_id", name="unique_user_thread"),
     )
 
-    user_a = relationship("User", foreign_keys=[user_a_id], back_populates="dm_threads_as_a")
-    user_b = relationship("User", foreign_keys=[user_b_id], back_populates="dm_threads_as_b")
-    messages = relationship("UserMessage", back_populates="thread", cascade="all, delete-orphan", order_by="UserMessage.created_at")
+    # Content of the newest message as a correlated subquery, so listings need
+    # not load the messages collection. Deferred: only queries that undefer()
+    # it pay for the subquery.
+    last_message_content = column_property(
+        select(UserMessage.content)
+        .where(UserMessage.thread_id == id)
+        .order_by(UserMessage.created_at.desc())
+        .limit(1)
+        .correlate_except(UserMessage)
+        .scalar_subquery(),
+        deferred=True,
+        raiseload=True,
+    )
+
+    user_a = relationship("User", foreign_keys=[user_a_id], back_populates="dm_threads_as_a", lazy="raise_on_sql")
+    user_b = relationship("User", foreign_keys=[user_b_id], back_populates="dm_threads_as_b", lazy="raise_on_sql")
+    messages = relationship("UserMessage", back_populates="thread", cascade="all, delete-orphan", order_by="UserMessage.created_at", lazy="selectin")
@@ -1,26 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from jose import jwt
-from datetime import datetime, timedelta
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import raiseload
+import jwt
+import time
+from datetime import timedelta
 from typing import Optional
 
 from app.database import get_db
-from app.config import get_settings
 from app.models.user import User
 from app.models.team import Team, TeamType
 from app.schemas.auth import LoginRequest, LoginResponse
 from app.services.bb_api import BBApiClient
+from app.dependencies import ACCESS_TOKEN_TTL, JWT_ALGORITHM, SIGNING_KEY
 
 router = APIRouter()
-settings = get_settings()
+# Stateless without a bb_key, so one instance serves every login
+bb_client = BBApiClient()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    # Numeric exp (RFC 7519 NumericDate) skips building a datetime per token
+    ttl = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_TTL
+    return jwt.encode({**data, "exp": int(time.time()) + ttl}, SIGNING_KEY, algorithm=JWT_ALGORITHM)
 
 
 @router.post("/login", response_model=LoginResponse)
@@ -28,7 +31,6 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
     """Login with BuzzerBeater credentials"""
 
     # Call BuzzerBeater API to authenticate
-    bb_client = BBApiClient()
     result = await bb_client.login(request.username, request.password)
 
     if not result.get("success"):
@@ -38,52 +40,52 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
         )
 
     # Get or create user
-    stmt = select(User).where(User.username == result["username"])
+    # Login never touches relationships; raise instead of lazy-loading if it starts to
+    # login_name is the private, unique auth key; username is only the public name
+    stmt = select(User).where(User.login_name == result["login_name"]).options(raiseload("*"))
     db_result = await db.execute(stmt)
     user = db_result.scalar_one_or_none()
 
     if not user:
         user = User(
+            login_name=result["login_name"],
             username=result["username"],
             bb_key=result["bb_key"],
             supporter=result.get("supporter", False)
         )
         db.add(user)
+        # Assigns user.id (generated on flush) without committing; the user
+        # and their teams are committed together below
+        await db.flush()
     else:
         user.bb_key = result["bb_key"]
+        user.username = result["username"]
         user.supporter = result.get("supporter", False)
 
-    await db.commit()
-    await db.refresh(user)
-
-    # Create or update teams
-    first_team_id = None
-    for team_data in result.get("teams", []):
-        stmt = select(Team).where(Team.team_id == team_data["team_id"])
-        team_result = await db.execute(stmt)
-        team = team_result.scalar_one_or_none()
-
-        if not team:
-            team = Team(
-                team_id=team_data["team_id"],
-                name=team_data["name"],
-                short_name=team_data["name"][:3].upper(),
-                team_type=TeamType(team_data["team_type"]),
-                coach_id=user.id
-            )
-            db.add(team)
-        else:
-            team.name = team_data["name"]
-            team.coach_id = user.id
-
-        if first_team_id is None:
-            first_team_id = team_data["team_id"]
+    # Create or update teams in one upsert; team_id is unique, so existing
+    # rows get the new name and coach instead of a duplicate insert
+    teams_data = result.get("teams", [])
+    if teams_data:
+        stmt = mysql_insert(Team).values([
+            {
+                "team_id": team_data["team_id"],
+                "name": team_data["name"],
+                "short_name": team_data["name"][:3].upper(),
+                "team_type": TeamType(team_data["team_type"]),
+                "coach_id": user.id,
+            }
+            for team_data in teams_data
+        ])
+        stmt = stmt.on_duplicate_key_update(name=stmt.inserted.name, coach_id=stmt.inserted.coach_id)
+        await db.execute(stmt)
+
+    first_team_id = teams_data[0]["team_id"] if teams_data else None
 
     await db.commit()
 
     # Create JWT token
     access_token = create_access_token(
-        data={"sub": user.username, "team_id": first_team_id}
+        data={"sub": user.login_name, "uid": str(user.id), "team_id": first_team_id}
     )
 
     return LoginResponse(
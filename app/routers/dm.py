@@ -1,27 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, or_, update
+from sqlalchemy.orm import joinedload, raiseload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime, timezone
 import asyncio
 import json
+import logging
+import orjson
 
-from app.database import get_db
+from app.database import async_session, get_db, STRICT_LOADING
 from app.models.user import User
 from app.models.user_thread import UserThread
 from app.models.user_message import UserMessage
 from app.routers.user import get_current_user_from_cookie
-from app.ws import manager
-from app.routers.user import TOKEN_COOKIE_NAME, settings
-from jose import jwt
-from sqlalchemy import select
+from app.ws import manager, dm_threads_cache_key
+from app.routers.user import TOKEN_COOKIE_NAME
+from app.dependencies import JWT_ALGORITHMS, SIGNING_KEY
+import jwt
 
 router = APIRouter()
 
+# Thread lists are invalidated on every change that affects them; the TTL only
+# bounds staleness of participant usernames
+DM_THREADS_CACHE_TTL = 60
+
 
 def to_camel(string: str) -> str:
     components = string.split('_')
@@ -74,6 +81,11 @@ class ThreadDto(BaseModel):
     unread_count: int = 0
 
 
+# Wire names of ThreadDto fields, resolved once; get_my_dms emits ThreadDto
+# rows as plain dicts and serializes them with orjson
+_THREAD_DTO_ALIASES = {name: field.alias or name for name, field in ThreadDto.model_fields.items()}
+
+
 class ThreadDetailDto(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
@@ -88,12 +100,10 @@ class ThreadDetailDto(BaseModel):
     messages: List[MessageDto]
 
 
-def _get_unread_count(thread: UserThread, current_user_id: UUID) -> int:
-    return sum(1 for msg in thread.messages if msg.sender_id != current_user_id and msg.read_at is None)
-
-
 def _make_message_dto(msg: UserMessage, current_user_id: UUID) -> MessageDto:
-    return MessageDto(
+    # DTOs in this module are built from loaded rows, which are already typed,
+    # so they skip validation via model_construct
+    return MessageDto.model_construct(
         id=msg.id,
         content=msg.content,
         sender_id=msg.sender_id,
@@ -108,32 +118,50 @@ def _make_message_dto(msg: UserMessage, current_user_id: UUID) -> MessageDto:
 async def get_my_dms(request: Request, db: AsyncSession = Depends(get_db)):
     current_user = await get_current_user_from_cookie(request, db)
 
+    cache_key = dm_threads_cache_key(current_user.id)
+    cached = await manager.cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    is_participant = or_(UserThread.user_a_id == current_user.id, UserThread.user_b_id == current_user.id)
+
+    # Unread counts and last messages are computed in SQL, one row per thread,
+    # instead of loading every message of every thread
+    unread = (
+        select(UserMessage.thread_id, func.count().label("unread_count"))
+        .join(UserThread, UserThread.id == UserMessage.thread_id)
+        .where(is_participant, UserMessage.sender_id != current_user.id, UserMessage.read_at.is_(None))
+        .group_by(UserMessage.thread_id)
+        .subquery()
+    )
+
     stmt = (
-        select(UserThread)
-        .options(selectinload(UserThread.messages), selectinload(UserThread.user_a), selectinload(UserThread.user_b))
-        .where(or_(UserThread.user_a_id == current_user.id, UserThread.user_b_id == current_user.id))
+        select(UserThread, func.coalesce(unread.c.unread_count, 0))
+        .outerjoin(unread, unread.c.thread_id == UserThread.id)
+        .options(undefer(UserThread.last_message_content), raiseload(UserThread.messages), joinedload(UserThread.user_a), joinedload(UserThread.user_b), *STRICT_LOADING)
+        .where(is_participant)
         .order_by(UserThread.updated_at.desc())
     )
     result = await db.execute(stmt)
-    threads = result.scalars().all()
 
     out = []
-    for thread in threads:
+    for thread, unread_count in result.all():
         # choose the other participant
         other = thread.user_a if thread.user_a_id != current_user.id else thread.user_b
-        out.append(
-            ThreadDto(
-                id=thread.id,
-                participant_id=other.id,
-                participant_username=other.username or other.login_name,
-                created_at=thread.created_at,
-                updated_at=thread.updated_at,
-                last_message=thread.messages[-1].content if thread.messages else None,
-                unread_count=_get_unread_count(thread, current_user.id),
-            )
+        row = dict(
+            id=thread.id,
+            participant_id=other.id,
+            participant_username=other.username or other.login_name,
+            created_at=thread.created_at,
+            updated_at=thread.updated_at,
+            last_message=thread.last_message_content,
+            unread_count=unread_count,
         )
+        out.append({_THREAD_DTO_ALIASES[key]: value for key, value in row.items()})
 
-    return out
+    body = orjson.dumps(out)
+    await manager.cache_set(cache_key, body, DM_THREADS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=ThreadDetailDto)
@@ -151,9 +179,12 @@ async def create_or_get_dm(request: Request, body: CreateDmRequest, db: AsyncSes
         raise HTTPException(status_code=400, detail="Cannot DM yourself")
 
     # order ids to match unique constraint
-    a_id, b_id = (current_user.id, recipient.id) if str(current_user.id) < str(recipient.id) else (recipient.id, current_user.id)
+    a_id, b_id = (current_user.id, recipient.id) if current_user.id < recipient.id else (recipient.id, current_user.id)
 
-    stmt = select(UserThread).where(UserThread.user_a_id == a_id, UserThread.user_b_id == b_id)
+    # Messages come along with an existing thread. Senders are the two
+    # participants, who are already in the session, so the sender load is
+    # served from the identity map
+    stmt = select(UserThread).options(selectinload(UserThread.messages).selectinload(UserMessage.sender), *STRICT_LOADING).where(UserThread.user_a_id == a_id, UserThread.user_b_id == b_id)
     result = await db.execute(stmt)
     thread = result.scalar_one_or_none()
 
@@ -161,27 +192,26 @@ async def create_or_get_dm(request: Request, body: CreateDmRequest, db: AsyncSes
         thread = UserThread(user_a_id=a_id, user_b_id=b_id, is_active=True)
         db.add(thread)
         await db.commit()
-        await db.refresh(thread)
+        await manager.cache_delete(dm_threads_cache_key(a_id), dm_threads_cache_key(b_id))
+        # A new thread has no messages; nothing to load
+        set_committed_value(thread, "messages", [])
 
-    # load messages
-    stmt = select(UserThread).options(selectinload(UserThread.messages), selectinload(UserThread.user_a), selectinload(UserThread.user_b)).where(UserThread.id == thread.id)
-    result = await db.execute(stmt)
-    thread = result.scalar_one()
-
-    other = thread.user_a if thread.user_a_id != current_user.id else thread.user_b
-
-    return ThreadDetailDto(
+    return ThreadDetailDto.model_construct(
         id=thread.id,
-        participant_id=other.id,
-        participant_username=other.username or other.login_name,
+        participant_id=recipient.id,
+        participant_username=recipient.username or recipient.login_name,
         is_active=thread.is_active,
         messages=[_make_message_dto(m, current_user.id) for m in thread.messages],
     )
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, db: AsyncSession = Depends(get_db)):
-    """WebSocket endpoint for receiving DM events. Authenticates using session cookie."""
+async def websocket_endpoint(websocket: WebSocket):
+    """WebSocket endpoint for receiving DM events. Authenticates using session cookie.
+
+    No request-scoped session: it would stay checked out of the pool for as
+    long as the socket is open.
+    """
     await websocket.accept()
     # Attempt to read cookie token
     token = websocket.cookies.get(TOKEN_COOKIE_NAME)
@@ -190,21 +220,24 @@ async def websocket_endpoint(websocket: WebSocket, db: AsyncSession = Depends(ge
         return
 
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        login_name = payload.get("sub")
+        payload = jwt.decode(token, SIGNING_KEY, algorithms=JWT_ALGORITHMS)
     except Exception:
         await websocket.close(code=1008)
         return
 
-    # Load user from DB
-    stmt = select(User).where(User.login_name == login_name)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    if not user:
-        await websocket.close(code=1008)
-        return
+    # Session tokens carry the user id, so connecting needs no DB round trip
+    user_id = payload.get("uid")
+    if not user_id:
+        # Tokens issued before uid was added: resolve the user by login name
+        async with async_session() as db:
+            stmt = select(User.id).where(User.login_name == payload.get("sub"))
+            result = await db.execute(stmt)
+            uid = result.scalar_one_or_none()
+        if uid is None:
+            await websocket.close(code=1008)
+            return
+        user_id = str(uid)
 
-    user_id = str(user.id)
     await manager.connect(user_id, websocket)
 
     try:
@@ -219,9 +252,12 @@ async def websocket_endpoint(websocket: WebSocket, db: AsyncSession = Depends(ge
 
 
 @router.get("/events")
-async def sse_events(request: Request, db: AsyncSession = Depends(get_db)):
+async def sse_events(request: Request):
     """Server-Sent Events endpoint for DM notifications. Works through Netlify proxy."""
-    current_user = await get_current_user_from_cookie(request, db)
+    # Same as the websocket: a request-scoped session would be held for the
+    # whole stream, so only the auth lookup gets one
+    async with async_session() as db:
+        current_user = await get_current_user_from_cookie(request, db)
     user_id = str(current_user.id)
 
     async def event_generator():
@@ -253,7 +289,7 @@ async def sse_events(request: Request, db: AsyncSession = Depends(get_db)):
 async def get_dm(thread_id: UUID, request: Request, db: AsyncSession = Depends(get_db)):
     current_user = await get_current_user_from_cookie(request, db)
 
-    stmt = select(UserThread).options(selectinload(UserThread.messages).selectinload(UserMessage.sender), selectinload(UserThread.user_a), selectinload(UserThread.user_b)).where(UserThread.id == thread_id)
+    stmt = select(UserThread).options(selectinload(UserThread.messages).selectinload(UserMessage.sender), joinedload(UserThread.user_a), joinedload(UserThread.user_b), *STRICT_LOADING).where(UserThread.id == thread_id)
     result = await db.execute(stmt)
     thread = result.scalar_one_or_none()
     if not thread:
@@ -265,21 +301,23 @@ async def get_dm(thread_id: UUID, request: Request, db: AsyncSession = Depends(g
 
     other = thread.user_a if thread.user_a_id != current_user.id else thread.user_b
 
-    # mark messages read
-    stmt = (
-        update(UserMessage)
-        .where(UserMessage.thread_id == thread.id, UserMessage.sender_id != current_user.id, UserMessage.read_at.is_(None))
-        .values(read_at=datetime.now(timezone.utc))
-    )
-    await db.execute(stmt)
-    await db.commit()
-
-    # reload messages
-    stmt = select(UserThread).options(selectinload(UserThread.messages).selectinload(UserMessage.sender), selectinload(UserThread.user_a), selectinload(UserThread.user_b)).where(UserThread.id == thread_id)
-    result = await db.execute(stmt)
-    thread = result.scalar_one()
+    # mark the loaded messages read, then patch them in memory instead of reloading
+    unread = [msg for msg in thread.messages if msg.sender_id != current_user.id and msg.read_at is None]
+    if unread:
+        read_at = datetime.now(timezone.utc)
+        stmt = (
+            update(UserMessage)
+            .where(UserMessage.id.in_([msg.id for msg in unread]))
+            .values(read_at=read_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+        await db.commit()
+        for msg in unread:
+            set_committed_value(msg, "read_at", read_at)
+        await manager.cache_delete(dm_threads_cache_key(current_user.id))
 
-    return ThreadDetailDto(
+    return ThreadDetailDto.model_construct(
         id=thread.id,
         participant_id=other.id,
         participant_username=other.username or other.login_name,
@@ -292,7 +330,7 @@ async def get_dm(thread_id: UUID, request: Request, db: AsyncSession = Depends(g
 async def send_dm(thread_id: UUID, body: SendDmRequest, request: Request, db: AsyncSession = Depends(get_db)):
     current_user = await get_current_user_from_cookie(request, db)
 
-    stmt = select(UserThread).where(UserThread.id == thread_id)
+    stmt = select(UserThread).options(raiseload(UserThread.messages)).where(UserThread.id == thread_id)
     result = await db.execute(stmt)
     thread = result.scalar_one_or_none()
     if not thread:
@@ -303,34 +341,34 @@ async def send_dm(thread_id: UUID, body: SendDmRequest, request: Request, db: As
 
     msg = UserMessage(thread_id=thread.id, sender_id=current_user.id, content=body.content)
     db.add(msg)
-    # update thread updated_at
-    thread.updated_at = datetime.now(timezone.utc)
+    # update thread updated_at; stamped by MySQL in UTC like the Python defaults
+    thread.updated_at = func.utc_timestamp()
     await db.commit()
-    await db.refresh(msg)
+    await manager.cache_delete(dm_threads_cache_key(thread.user_a_id), dm_threads_cache_key(thread.user_b_id))
 
     # Notify other participant via websocket (if connected)
     other_id = thread.user_a_id if thread.user_a_id != current_user.id else thread.user_b_id
     payload = {
         "event": "dm:new_message",
-        "threadId": str(thread.id),
+        "threadId": thread.id,
         "message": {
-            "id": str(msg.id),
+            "id": msg.id,
             "content": msg.content,
-            "senderId": str(msg.sender_id),
+            "senderId": msg.sender_id,
             "senderUsername": current_user.username or current_user.login_name,
-            "createdAt": msg.created_at.isoformat(),
+            "createdAt": msg.created_at,
         }
     }
-    # fire and forget
-    try:
-        await manager.send_json_to_user(str(other_id), payload)
-    except Exception:
-        pass
-    # publish to Redis so other instances can forward to their connected sockets
-    try:
-        await manager.publish('dm:events', {'target_user_id': str(other_id), 'payload': payload})
-    except Exception:
+    # fire and forget: push to local sockets and publish to Redis (so other
+    # instances can forward to their connected sockets) concurrently
+    results = await asyncio.gather(
+        manager.send_json_to_user(str(other_id), payload),
+        manager.publish('dm:events', {'target_user_id': other_id, 'payload': payload}),
+        return_exceptions=True,
+    )
+    for outcome in results:
         # non-fatal
-        pass
+        if isinstance(outcome, Exception):
+            logging.warning("DM notification failed: %s", outcome)
 
     return _make_message_dto(msg, current_user.id)
@@ -2,11 +2,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from app.database import get_db
+from app.database import get_db, STRICT_LOADING
 from app.models.user import User
-from app.models.team import Team
 from app.models.player import Player
 from app.models.player_training_plan import PlayerTrainingPlan
 from app.models.player_share import PlayerShare
@@ -22,9 +21,14 @@ _PLAN_ATTRS = [
 ]
 
 
+def _is_owned_by(player: Player, user: User) -> bool:
+    """Ownership check against the eagerly loaded current_team."""
+    return player.current_team is not None and player.current_team.coach_id == user.id
+
+
 async def _get_owned_player(db: AsyncSession, user: User, player_id: int) -> Player:
     """Resolve BB player_id to Player and ensure current user owns them."""
-    stmt = select(Player).options(selectinload(Player.current_team)).where(
+    stmt = select(Player).options(joinedload(Player.current_team), *STRICT_LOADING).where(
         Player.player_id == player_id
     )
     result = await db.execute(stmt)
@@ -32,10 +36,8 @@ async def _get_owned_player(db: AsyncSession, user: User, player_id: int) -> Pla
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    stmt = select(Team.id).where(Team.coach_id == user.id)
-    result = await db.execute(stmt)
-    user_team_ids = [r[0] for r in result.all()]
-    if player.current_team_id not in user_team_ids:
+    # The team is joined in above, so ownership needs no extra query
+    if not _is_owned_by(player, user):
         raise HTTPException(status_code=403, detail="Not your player")
 
     return player
@@ -43,7 +45,7 @@ async def _get_owned_player(db: AsyncSession, user: User, player_id: int) -> Pla
 
 async def _get_viewable_player(db: AsyncSession, user: User, player_id: int) -> Player:
     """Resolve BB player_id → Player. Allow if owner OR shared with share_plan=True."""
-    stmt = select(Player).options(selectinload(Player.current_team)).where(
+    stmt = select(Player).options(joinedload(Player.current_team), *STRICT_LOADING).where(
         Player.player_id == player_id
     )
     result = await db.execute(stmt)
@@ -52,10 +54,7 @@ async def _get_viewable_player(db: AsyncSession, user: User, player_id: int) ->
         raise HTTPException(status_code=404, detail="Player not found")
 
     # Check ownership
-    stmt = select(Team.id).where(Team.coach_id == user.id)
-    result = await db.execute(stmt)
-    user_team_ids = [r[0] for r in result.all()]
-    if player.current_team_id in user_team_ids:
+    if _is_owned_by(player, user):
         return player
 
     # Check share with share_plan=True
@@ -126,7 +125,6 @@ async def upsert_plan(
         db.add(plan)
 
     await db.commit()
-    await db.refresh(plan)
     return _plan_to_response(plan, player.player_id)
 
 
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy.orm import joinedload, aliased
 from typing import List
+import asyncio
 
-from app.database import get_db
+from app.database import get_db, STRICT_LOADING
 from app.models.user import User
 from app.models.team import Team
 from app.models.player import Player
@@ -12,13 +14,20 @@ from app.models.player_share import PlayerShare
 from app.models.match_boxscore import MatchBoxscore, MatchTeamBoxscore, MatchPlayerBoxscore
 from app.models.nt_match_boxscore import NTMatchBoxscore, NTMatchTeamBoxscore, NTMatchPlayerBoxscore
 from app.schemas.player import PlayerResponse, PlayerRosterResponse
-from app.dependencies import get_current_user, get_current_team_id
+from app.dependencies import get_current_user, get_current_user_with_bb_key, get_current_team_id
 from app.services.bb_api import BBApiClient
+from app.services.roster import upsert_roster
 
 router = APIRouter()
 
 
-@router.get("/roster", response_model=List[dict])
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a player name into (first name, rest), splitting only once."""
+    parts = name.split() if name else []
+    return (parts[0] if parts else ""), " ".join(parts[1:])
+
+
+@router.get("/roster", response_model=List[dict], response_class=ORJSONResponse)
 async def get_roster(
     show_archived: bool = False,
     current_user: User = Depends(get_current_user),
@@ -34,20 +43,30 @@ async def get_roster(
     if not team:
         return []
 
-    # Get players
-    stmt = select(Player).where(Player.current_team_id == team.id)
+    # Get players as plain rows of the rendered columns; no ORM objects needed
+    stmt = select(
+        Player.id, Player.player_id, Player.name, Player.country, Player.age,
+        Player.height, Player.salary, Player.dmi, Player.best_position,
+        Player.potential, Player.active,
+        Player.jump_shot, Player.jump_range, Player.outside_defense, Player.handling,
+        Player.driving, Player.passing, Player.inside_shot, Player.inside_defense,
+        Player.rebounding, Player.shot_blocking, Player.stamina, Player.free_throws,
+        Player.experience,
+    ).where(Player.current_team_id == team.id)
     if not show_archived:
         stmt = stmt.where(Player.active == True)
 
     result = await db.execute(stmt)
-    players = result.scalars().all()
+    players = result.all()
 
-    return [
-        {
+    roster = []
+    for player in players:
+        first_name, last_name = _split_name(player.name)
+        roster.append({
             "id": str(player.id),
             "playerId": player.player_id,
-            "firstName": player.name.split()[0] if player.name else "",
-            "lastName": " ".join(player.name.split()[1:]) if player.name and len(player.name.split()) > 1 else "",
+            "firstName": first_name,
+            "lastName": last_name,
             "nationality": player.country,
             "age": player.age,
             "height": player.height,
@@ -71,14 +90,16 @@ async def get_roster(
                 "freeThrows": player.free_throws,
                 "experience": player.experience,
             }
-        }
-        for player in players
-    ]
+        })
+
+    # Returned as a response so the list skips response_model validation and
+    # jsonable_encoder; response_model stays for the OpenAPI schema
+    return ORJSONResponse(roster)
 
 
 @router.post("/sync")
 async def sync_roster(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_bb_key),
     current_team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
@@ -86,102 +107,28 @@ async def sync_roster(
     if not current_user.bb_key:
         raise HTTPException(status_code=400, detail="BB key not available")
 
-    # Get team from database
-    stmt = select(Team).where(Team.team_id == current_team_id)
-    result = await db.execute(stmt)
+    # Fetch roster from BB API while the team is read from the database; the
+    # lookup is the only one of the two that uses the session. The task group
+    # cancels and waits for the sibling if either fails, so the session is
+    # never closed under a running query.
+    bb_client = BBApiClient(current_user.bb_key)
+    async with asyncio.TaskGroup() as tg:
+        roster_task = tg.create_task(bb_client.get_roster(current_team_id))
+        result = await db.execute(select(Team).where(Team.team_id == current_team_id))
     team = result.scalar_one_or_none()
+    bb_players = roster_task.result()
 
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    # Fetch roster from BB API
-    bb_client = BBApiClient(current_user.bb_key)
-    bb_players = await bb_client.get_roster(current_team_id)
-
-    # Get current player IDs from BB
-    bb_player_ids = {p["player_id"] for p in bb_players}
-
-    # Mark players not in roster as inactive
-    stmt = select(Player).where(Player.current_team_id == team.id)
-    result = await db.execute(stmt)
-    existing_players = result.scalars().all()
-
-    for player in existing_players:
-        if player.player_id not in bb_player_ids:
-            player.active = False
-
-    # Update or create players
-    synced_count = 0
-    for bb_player in bb_players:
-        stmt = select(Player).where(Player.player_id == bb_player["player_id"])
-        result = await db.execute(stmt)
-        player = result.scalar_one_or_none()
-
-        if player:
-            # Update existing player
-            player.name = bb_player["name"]
-            player.country = bb_player["nationality"]
-            player.age = bb_player["age"]
-            player.height = bb_player["height"]
-            player.potential = bb_player["potential"]
-            player.salary = bb_player["salary"]
-            player.dmi = bb_player["dmi"]
-            player.best_position = bb_player["best_position"]
-            player.game_shape = bb_player["game_shape"]
-            player.jump_shot = bb_player["jump_shot"]
-            player.jump_range = bb_player["jump_range"]
-            player.outside_defense = bb_player["outside_defense"]
-            player.handling = bb_player["handling"]
-            player.driving = bb_player["driving"]
-            player.passing = bb_player["passing"]
-            player.inside_shot = bb_player["inside_shot"]
-            player.inside_defense = bb_player["inside_defense"]
-            player.rebounding = bb_player["rebounding"]
-            player.shot_blocking = bb_player["shot_blocking"]
-            player.stamina = bb_player["stamina"]
-            player.free_throws = bb_player["free_throws"]
-            player.experience = bb_player["experience"]
-            player.current_team_id = team.id
-            player.active = True
-        else:
-            # Create new player
-            player = Player(
-                player_id=bb_player["player_id"],
-                name=bb_player["name"],
-                country=bb_player["nationality"],
-                age=bb_player["age"],
-                height=bb_player["height"],
-                potential=bb_player["potential"],
-                salary=bb_player["salary"],
-                dmi=bb_player["dmi"],
-                best_position=bb_player["best_position"],
-                game_shape=bb_player["game_shape"],
-                jump_shot=bb_player["jump_shot"],
-                jump_range=bb_player["jump_range"],
-                outside_defense=bb_player["outside_defense"],
-                handling=bb_player["handling"],
-                driving=bb_player["driving"],
-                passing=bb_player["passing"],
-                inside_shot=bb_player["inside_shot"],
-                inside_defense=bb_player["inside_defense"],
-                rebounding=bb_player["rebounding"],
-                shot_blocking=bb_player["shot_blocking"],
-                stamina=bb_player["stamina"],
-                free_throws=bb_player["free_throws"],
-                experience=bb_player["experience"],
-                current_team_id=team.id,
-                active=True
-            )
-            db.add(player)
-
-        synced_count += 1
+    synced_count = await upsert_roster(db, team, bb_players)
 
     await db.commit()
 
     return {"success": True, "message": f"Synced {synced_count} players"}
 
 
-@router.get("/all")
+@router.get("/all", response_class=ORJSONResponse)
 async def get_all_players(
     shared_only: bool = False,
     page: int = 1,
@@ -193,63 +140,71 @@ async def get_all_players(
     """Get all players except those from current user's teams (paginated)"""
     from sqlalchemy import func
 
-    # Get all teams owned by current user
-    stmt = select(Team.id).where(Team.coach_id == current_user.id)
-    result = await db.execute(stmt)
-    user_team_ids = [row[0] for row in result.all()]
-
-    # Get shares where current user is recipient
-    shares_stmt = select(PlayerShare.player_id).where(
-        PlayerShare.recipient_id == current_user.id
+    # Ownership and shares are correlated subqueries, so neither the user's
+    # team ids nor their shared player ids are pulled into Python first. The
+    # ownership check uses its own Team alias so it does not correlate to the
+    # team joined in for teamName below.
+    owned_team = aliased(Team)
+    is_own_team = (
+        select(owned_team.id)
+        .where(owned_team.id == Player.current_team_id, owned_team.coach_id == current_user.id)
+        .exists()
+    )
+    is_shared_with_me = (
+        select(PlayerShare.id)
+        .where(PlayerShare.player_id == Player.id, PlayerShare.recipient_id == current_user.id)
+        .exists()
     )
-    shares_result = await db.execute(shares_stmt)
-    shared_player_ids = {row[0] for row in shares_result.all()}
 
-    # Build base query for players
+    # Build filters for players
     if shared_only:
-        if not shared_player_ids:
-            return {"players": [], "total": 0, "page": page, "pageSize": page_size, "totalPages": 0}
-        base_query = select(Player).where(
-            Player.id.in_(shared_player_ids)
-        )
+        filters = [is_shared_with_me]
     else:
-        if user_team_ids:
-            base_query = select(Player).where(
-                Player.active == True,
-                Player.current_team_id.notin_(user_team_ids)
-            )
-        else:
-            base_query = select(Player).where(
-                Player.active == True
-            )
+        filters = [Player.active == True, ~is_own_team]
 
     # Get total count
-    count_stmt = select(func.count()).select_from(base_query.subquery())
+    count_stmt = select(func.count()).select_from(Player).where(*filters)
     total_result = await db.execute(count_stmt)
     total = total_result.scalar()
 
-    # Apply pagination
+    # Apply pagination, selecting only the columns the list renders as plain
+    # rows; the team name comes from a join rather than a Team object
     offset = (page - 1) * page_size
-    stmt = base_query.options(selectinload(Player.current_team)).offset(offset).limit(page_size)
+    stmt = (
+        select(
+            Player.id, Player.player_id, Player.name, Player.country, Player.age,
+            Player.height, Player.best_position, Player.potential,
+            Player.jump_shot, Player.jump_range, Player.outside_defense, Player.handling,
+            Player.driving, Player.passing, Player.inside_shot, Player.inside_defense,
+            Player.rebounding, Player.shot_blocking, Player.stamina, Player.free_throws,
+            Player.experience,
+            Team.name.label("team_name"),
+            is_shared_with_me.label("is_shared"),
+        )
+        .outerjoin(Team, Team.id == Player.current_team_id)
+        .where(*filters)
+        .offset(offset)
+        .limit(page_size)
+    )
 
     result = await db.execute(stmt)
-    players = result.scalars().all()
+    rows = result.all()
 
     total_pages = (total + page_size - 1) // page_size
 
-    return {
+    return ORJSONResponse({
         "players": [
             {
                 "id": str(player.id),
                 "playerId": player.player_id,
                 "name": player.name,
                 "country": player.country,
-                "teamName": player.current_team.name if player.current_team else None,
+                "teamName": player.team_name,
                 "age": player.age,
                 "height": player.height,
                 "bestPosition": player.best_position,
                 "potential": player.potential,
-                "isSharedWithMe": player.id in shared_player_ids,
+                "isSharedWithMe": bool(player.is_shared),
                 "skills": {
                     "jumpShot": player.jump_shot,
                     "jumpRange": player.jump_range,
@@ -264,15 +219,15 @@ async def get_all_players(
                     "stamina": player.stamina,
                     "freeThrows": player.free_throws,
                     "experience": player.experience,
-                } if player.id in shared_player_ids else None,
+                } if player.is_shared else None,
             }
-            for player in players
+            for player in rows
         ],
         "total": total,
         "page": page,
         "pageSize": page_size,
         "totalPages": total_pages
-    }
+    })
 
 
 @router.get("/{player_id}/matches")
@@ -497,8 +452,8 @@ async def get_player(
     - Shared player: full access
     - Other player: public info only (no skills, salary, dmi, gameShape)
     """
-    # Find player by BB player_id
-    stmt = select(Player).options(selectinload(Player.current_team)).where(
+    # Find player by BB player_id; the team is joined in for the ownership check
+    stmt = select(Player).options(joinedload(Player.current_team), *STRICT_LOADING).where(
         Player.player_id == player_id
     )
     result = await db.execute(stmt)
@@ -507,13 +462,8 @@ async def get_player(
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    # Get all teams owned by current user
-    stmt = select(Team.id).where(Team.coach_id == current_user.id)
-    result = await db.execute(stmt)
-    user_team_ids = [row[0] for row in result.all()]
-
     # Check if player is owned by current user
-    is_own_player = player.current_team_id in user_team_ids
+    is_own_player = player.current_team is not None and player.current_team.coach_id == current_user.id
 
     # Check if player is shared with current user
     is_shared_player = False
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, func, select, delete, or_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import aliased, load_only, selectinload
 from typing import List
 from uuid import UUID
 from datetime import datetime
+from operator import attrgetter
+import time
 
-from app.database import get_db
+from app.database import get_db, STRICT_LOADING
 from app.models.user import User
 from app.models.team import Team
 from app.models.player import Player
@@ -15,68 +19,184 @@ from app.models.player_snapshot import PlayerSnapshot
 from app.models.player_training_plan import PlayerTrainingPlan
 from app.models.user_thread import UserThread
 from app.models.user_message import UserMessage
-from app.schemas.player_share import SharePlayerRequest, ShareResponse, PlayerShareDto, PlayerInShare, UpdateShareRequest, PlayerSnapshotDto, PlanTargets
+from app.schemas.player_share import SharePlayerRequest, ShareResponse, PlayerShareDto, UpdateShareRequest
 from app.schemas.user import UserSearchResult, UserSearchResponse
 from app.routers.user import get_current_user_from_cookie, get_current_team_id_from_cookie
+from app.ws import manager, dm_threads_cache_key
 
 router = APIRouter()
 
-
-def _snapshot_to_dto(snapshot: PlayerSnapshot | None) -> PlayerSnapshotDto | None:
+# Player columns read by the share listings (PlayerInShare plus the owner team
+# fallbacks); the rest of the row is never loaded
+_SHARE_PLAYER_COLUMNS = (
+    Player.player_id, Player.name, Player.age, Player.potential, Player.best_position,
+    Player.salary, Player.dmi, Player.game_shape, Player.active,
+    Player.current_team_id, Player.team_name,
+    Player.jump_shot, Player.jump_range, Player.outside_defense, Player.handling,
+    Player.driving, Player.passing, Player.inside_shot, Player.inside_defense,
+    Player.rebounding, Player.shot_blocking, Player.stamina, Player.free_throws,
+    Player.experience,
+)
+
+
+# Skill attribute -> JSON key, shared by the player, snapshot and plan shapes
+_SKILL_KEYS = (
+    ("jump_shot", "jumpShot"),
+    ("jump_range", "jumpRange"),
+    ("outside_defense", "outsideDefense"),
+    ("handling", "handling"),
+    ("driving", "driving"),
+    ("passing", "passing"),
+    ("inside_shot", "insideShot"),
+    ("inside_defense", "insideDefense"),
+    ("rebounding", "rebounding"),
+    ("shot_blocking", "shotBlocking"),
+    ("stamina", "stamina"),
+    ("free_throws", "freeThrows"),
+    ("experience", "experience"),
+)
+_SKILL_JSON_KEYS = tuple(key for _, key in _SKILL_KEYS)
+_get_skills = attrgetter(*(attr for attr, _ in _SKILL_KEYS))
+
+
+def _skills_to_dict(obj) -> dict:
+    return dict(zip(_SKILL_JSON_KEYS, _get_skills(obj)))
+
+
+def _snapshot_to_dict(snapshot: PlayerSnapshot | None) -> dict | None:
+    """PlayerSnapshotDto shape."""
     if snapshot is None:
         return None
-    return PlayerSnapshotDto(
-        year=snapshot.year,
-        week_of_year=snapshot.week_of_year,
-        played_nt_match=snapshot.played_nt_match,
-        jump_shot=snapshot.jump_shot,
-        jump_range=snapshot.jump_range,
-        outside_defense=snapshot.outside_defense,
-        handling=snapshot.handling,
-        driving=snapshot.driving,
-        passing=snapshot.passing,
-        inside_shot=snapshot.inside_shot,
-        inside_defense=snapshot.inside_defense,
-        rebounding=snapshot.rebounding,
-        shot_blocking=snapshot.shot_blocking,
-        stamina=snapshot.stamina,
-        free_throws=snapshot.free_throws,
-        experience=snapshot.experience,
-    )
+    return {
+        "year": snapshot.year,
+        "weekOfYear": snapshot.week_of_year,
+        "playedNtMatch": snapshot.played_nt_match,
+        **_skills_to_dict(snapshot),
+    }
 
 
-def _plan_to_targets(plan: PlayerTrainingPlan | None) -> PlanTargets | None:
+def _plan_to_dict(plan: PlayerTrainingPlan | None) -> dict | None:
+    """PlanTargets shape."""
     if plan is None:
         return None
-    return PlanTargets(
-        jump_shot=plan.jump_shot,
-        jump_range=plan.jump_range,
-        outside_defense=plan.outside_defense,
-        handling=plan.handling,
-        driving=plan.driving,
-        passing=plan.passing,
-        inside_shot=plan.inside_shot,
-        inside_defense=plan.inside_defense,
-        rebounding=plan.rebounding,
-        shot_blocking=plan.shot_blocking,
-        stamina=plan.stamina,
-        free_throws=plan.free_throws,
-        experience=plan.experience,
+    return _skills_to_dict(plan)
+
+
+def _share_to_dict(
+    share: PlayerShare,
+    owner_username: str | None,
+    recipient_username: str | None,
+    team_id: int | None,
+    team_name: str | None,
+    latest_snapshot: PlayerSnapshot | None,
+    previous_snapshot: PlayerSnapshot | None,
+    plan: PlayerTrainingPlan | None,
+) -> dict:
+    """PlayerShareDto shape, built directly from loaded rows.
+
+    The share listings return these through ORJSONResponse; PlayerShareDto
+    stays on the routes as response_model for the OpenAPI schema only.
+    """
+    player = share.player
+    return {
+        "shareId": share.id,
+        "player": {
+            "id": player.id,
+            "playerId": player.player_id,
+            "name": player.name,
+            "age": player.age,
+            "potential": player.potential or 0,
+            "bestPosition": player.best_position,
+            "salary": player.salary,
+            "dmi": player.dmi,
+            "gameShape": player.game_shape,
+            "active": player.active,
+            **_skills_to_dict(player),
+        },
+        "ownerUsername": owner_username,
+        "ownerName": owner_username,
+        "ownerTeamName": team_name,
+        "ownerTeamId": team_id,
+        "recipientUsername": recipient_username,
+        "recipientName": recipient_username,
+        "sharedAt": share.created_at,
+        "sharePlan": share.share_plan,
+        "message": share.message,
+        "latestSnapshot": _snapshot_to_dict(latest_snapshot),
+        "previousSnapshot": _snapshot_to_dict(previous_snapshot),
+        "planTargets": _plan_to_dict(plan),
+    }
+
+
+async def _get_latest_snapshots(
+    db: AsyncSession, player_ids: set[UUID]
+) -> dict[UUID, tuple[PlayerSnapshot | None, PlayerSnapshot | None]]:
+    """Latest and previous snapshot per player, fetched in one windowed query."""
+    if not player_ids:
+        return {}
+    ranked = (
+        select(
+            PlayerSnapshot,
+            func.row_number().over(
+                partition_by=PlayerSnapshot.player_id,
+                order_by=(PlayerSnapshot.year.desc(), PlayerSnapshot.week_of_year.desc()),
+            ).label("rn"),
+        )
+        .where(PlayerSnapshot.player_id.in_(player_ids))
+        .subquery()
     )
+    snapshot = aliased(PlayerSnapshot, ranked)
+    stmt = select(snapshot).where(ranked.c.rn <= 2).order_by(ranked.c.player_id, ranked.c.rn)
+    result = await db.execute(stmt)
 
+    by_player: dict[UUID, list[PlayerSnapshot]] = {}
+    for row in result.scalars():
+        by_player.setdefault(row.player_id, []).append(row)
+    return {
+        pid: (snapshots[0], snapshots[1] if len(snapshots) > 1 else None)
+        for pid, snapshots in by_player.items()
+    }
+
+
+async def _load_owner_teams(db: AsyncSession, shares: list[PlayerShare]) -> tuple[dict, dict, dict]:
+    """Prefetch teams so ownerTeamId/Name are available even if the player's team isn't loaded.
+
+    Returns teams by id, teams by coach id and teams by (coach id, team name).
+    """
+    team_ids = {s.player.current_team_id for s in shares if s.player and s.player.current_team_id}
+    owner_ids = {s.owner_id for s in shares}
+    team_map = {}
+    teams_by_owner = {}
+    teams_by_owner_name = {}
+    if team_ids or owner_ids:
+        team_query = (
+            select(Team)
+            .options(load_only(Team.team_id, Team.name, Team.coach_id, raiseload=True))
+            .where(or_(Team.id.in_(team_ids), Team.coach_id.in_(owner_ids)))
+        )
+        team_result = await db.execute(team_query)
+        teams = team_result.scalars().all()
+        team_map = {t.id: t for t in teams}
+        for t in teams:
+            teams_by_owner.setdefault(t.coach_id, []).append(t)
+            teams_by_owner_name[(t.coach_id, t.name)] = t
+    return team_map, teams_by_owner, teams_by_owner_name
 
-async def _get_latest_snapshots(db: AsyncSession, player_id: UUID) -> tuple[PlayerSnapshot | None, PlayerSnapshot | None]:
-    stmt = (
-        select(PlayerSnapshot)
-        .where(PlayerSnapshot.player_id == player_id)
-        .order_by(PlayerSnapshot.year.desc(), PlayerSnapshot.week_of_year.desc())
-        .limit(2)
-    )
-    result = await db.execute(stmt)
-    snapshots = result.scalars().all()
-    latest = snapshots[0] if len(snapshots) > 0 else None
-    previous = snapshots[1] if len(snapshots) > 1 else None
-    return latest, previous
+
+def _resolve_owner_team(
+    share: PlayerShare, team_map: dict, teams_by_owner: dict, teams_by_owner_name: dict
+) -> tuple[int | None, str | None]:
+    player = share.player
+    if player.current_team:
+        return player.current_team.team_id, player.current_team.name
+    if player.current_team_id and (team := team_map.get(player.current_team_id)):
+        return team.team_id, team.name
+    if player.team_name and (team := teams_by_owner_name.get((share.owner_id, player.team_name))):
+        return team.team_id, team.name
+    owner_teams = teams_by_owner.get(share.owner_id, [])
+    if len(owner_teams) == 1:
+        return owner_teams[0].team_id, owner_teams[0].name
+    return None, None
 
 
 @router.post("", response_model=ShareResponse)
@@ -87,7 +207,7 @@ async def share_players(
 ):
     """Share players with another user"""
     current_user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
 
     # Find recipient
     stmt = select(User).where(User.username == share_request.recipient_username)
@@ -120,29 +240,32 @@ async def share_players(
     if not players:
         return ShareResponse(success=False, message="No players found to share")
 
-    # Create shares
-    shared_count = 0
-    for player in players:
-        # Check if share already exists
-        stmt = select(PlayerShare).where(
-            PlayerShare.player_id == player.id,
-            PlayerShare.recipient_id == recipient.id
-        )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if not existing:
-            share = PlayerShare(
-                player_id=player.id,
-                owner_id=current_user.id,
-                recipient_id=recipient.id,
-                share_plan=share_request.share_plan,
-                message=share_request.message,
-            )
-            db.add(share)
-            shared_count += 1
-
-    await db.commit()
+    # Find players already shared with the recipient in one query
+    stmt = select(PlayerShare.player_id).where(
+        PlayerShare.recipient_id == recipient.id,
+        PlayerShare.player_id.in_([player.id for player in players])
+    )
+    result = await db.execute(stmt)
+    already_shared = set(result.scalars().all())
+
+    # Create the missing shares in a single INSERT; a share created
+    # concurrently since the check above is left as it is
+    new_shares = [
+        {
+            "player_id": player.id,
+            "owner_id": current_user.id,
+            "recipient_id": recipient.id,
+            "share_plan": share_request.share_plan,
+            "message": share_request.message,
+        }
+        for player in players
+        if player.id not in already_shared
+    ]
+    shared_count = len(new_shares)
+    if new_shares:
+        stmt = mysql_insert(PlayerShare)
+        stmt = stmt.on_duplicate_key_update(recipient_id=PlayerShare.recipient_id)
+        await db.execute(stmt, new_shares)
 
     # Create DM notification if players were shared
     if shared_count > 0:
@@ -160,24 +283,27 @@ async def share_players(
         if share_request.message:
             notification_content += f"\n\nMessage: {share_request.message}"
 
-        # Get or create DM thread between the two users
-        a_id, b_id = (current_user.id, recipient.id) if str(current_user.id) < str(recipient.id) else (recipient.id, current_user.id)
-        stmt = select(UserThread).where(UserThread.user_a_id == a_id, UserThread.user_b_id == b_id)
-        result = await db.execute(stmt)
-        dm_thread = result.scalar_one_or_none()
-        if not dm_thread:
-            dm_thread = UserThread(user_a_id=a_id, user_b_id=b_id, is_active=True)
-            db.add(dm_thread)
-            await db.commit()
-            await db.refresh(dm_thread)
+        # Get or create the DM thread in one statement; an existing thread
+        # only has updated_at bumped for the new message
+        a_id, b_id = (current_user.id, recipient.id) if current_user.id < recipient.id else (recipient.id, current_user.id)
+        stmt = mysql_insert(UserThread).values(user_a_id=a_id, user_b_id=b_id, is_active=True)
+        stmt = stmt.on_duplicate_key_update(updated_at=func.utc_timestamp())
+        await db.execute(stmt)
 
+        # No RETURNING on MySQL, and an existing thread keeps its own id
+        result = await db.execute(
+            select(UserThread.id).where(UserThread.user_a_id == a_id, UserThread.user_b_id == b_id)
+        )
         dm_msg = UserMessage(
-            thread_id=dm_thread.id,
+            thread_id=result.scalar_one(),
             sender_id=current_user.id,
             content=notification_content,
         )
         db.add(dm_msg)
+
+        # Shares, thread and message are committed together
         await db.commit()
+        await manager.cache_delete(dm_threads_cache_key(a_id), dm_threads_cache_key(b_id))
 
     return ShareResponse(
         success=True,
@@ -197,94 +323,40 @@ async def get_received_shares(
     stmt = (
         select(PlayerShare)
         .options(
-            selectinload(PlayerShare.player).selectinload(Player.current_team),
-            selectinload(PlayerShare.owner),
+            selectinload(PlayerShare.player)
+            .load_only(*_SHARE_PLAYER_COLUMNS, raiseload=True)
+            .selectinload(Player.current_team)
+            .load_only(Team.team_id, Team.name, raiseload=True),
+            selectinload(PlayerShare.player).selectinload(Player.training_plan),
+            selectinload(PlayerShare.owner).load_only(User.username, raiseload=True),
+            *STRICT_LOADING,
         )
         .where(PlayerShare.recipient_id == current_user.id)
     )
     result = await db.execute(stmt)
     shares = result.scalars().all()
 
-    # Prefetch teams to ensure ownerTeamId/Name are available even if relationship isn't loaded
-    team_ids = {s.player.current_team_id for s in shares if s.player and s.player.current_team_id}
-    owner_ids = {s.owner_id for s in shares}
-    team_map = {}
-    teams_by_owner = {}
-    teams_by_owner_name = {}
-    if team_ids or owner_ids:
-        team_query = select(Team).where(or_(Team.id.in_(team_ids), Team.coach_id.in_(owner_ids)))
-        team_result = await db.execute(team_query)
-        teams = team_result.scalars().all()
-        team_map = {t.id: t for t in teams}
-        for t in teams:
-            teams_by_owner.setdefault(t.coach_id, []).append(t)
-            teams_by_owner_name[(t.coach_id, t.name)] = t
-    def resolve_owner_team(share: PlayerShare) -> tuple[int | None, str | None]:
-        if share.player.current_team:
-            return share.player.current_team.team_id, share.player.current_team.name
-        if share.player.current_team_id and team_map.get(share.player.current_team_id):
-            team = team_map.get(share.player.current_team_id)
-            return team.team_id, team.name
-        if share.player.team_name and teams_by_owner_name.get((share.owner_id, share.player.team_name)):
-            team = teams_by_owner_name.get((share.owner_id, share.player.team_name))
-            return team.team_id, team.name
-        owner_teams = teams_by_owner.get(share.owner_id, [])
-        if len(owner_teams) == 1:
-            return owner_teams[0].team_id, owner_teams[0].name
-        return None, None
-
-    out: list[PlayerShareDto] = []
-    for share in shares:
-        team_id, team_name = resolve_owner_team(share)
-        latest_snapshot, previous_snapshot = await _get_latest_snapshots(db, share.player.id)
-        plan_targets = None
-        if share.share_plan:
-            plan_result = await db.execute(
-                select(PlayerTrainingPlan).where(PlayerTrainingPlan.player_id == share.player.id)
-            )
-            plan_targets = _plan_to_targets(plan_result.scalar_one_or_none())
-        out.append(PlayerShareDto(
-            share_id=share.id,
-            player=PlayerInShare(
-                id=share.player.id,
-                player_id=share.player.player_id,
-                name=share.player.name,
-                age=share.player.age,
-                potential=share.player.potential or 0,
-                best_position=share.player.best_position,
-                salary=share.player.salary,
-                dmi=share.player.dmi,
-                game_shape=share.player.game_shape,
-                active=share.player.active,
-                jump_shot=share.player.jump_shot,
-                jump_range=share.player.jump_range,
-                outside_defense=share.player.outside_defense,
-                handling=share.player.handling,
-                driving=share.player.driving,
-                passing=share.player.passing,
-                inside_shot=share.player.inside_shot,
-                inside_defense=share.player.inside_defense,
-                rebounding=share.player.rebounding,
-                shot_blocking=share.player.shot_blocking,
-                stamina=share.player.stamina,
-                free_throws=share.player.free_throws,
-                experience=share.player.experience,
-            ),
+    snapshots = await _get_latest_snapshots(db, {s.player_id for s in shares})
+
+    team_map, teams_by_owner, teams_by_owner_name = await _load_owner_teams(db, shares)
+    resolved = [_resolve_owner_team(s, team_map, teams_by_owner, teams_by_owner_name) for s in shares]
+
+    out = []
+    for share, (team_id, team_name) in zip(shares, resolved):
+        latest_snapshot, previous_snapshot = snapshots.get(share.player_id, (None, None))
+        plan = share.player.training_plan if share.share_plan else None
+        out.append(_share_to_dict(
+            share,
             owner_username=share.owner.username,
-            owner_name=share.owner.username,
-            owner_team_name=team_name,
-            owner_team_id=team_id,
             recipient_username=current_user.username,
-            recipient_name=current_user.username,
-            shared_at=share.created_at,
-            share_plan=share.share_plan,
-            message=share.message,
-            latest_snapshot=_snapshot_to_dto(latest_snapshot),
-            previous_snapshot=_snapshot_to_dto(previous_snapshot),
-            plan_targets=plan_targets,
+            team_id=team_id,
+            team_name=team_name,
+            latest_snapshot=latest_snapshot,
+            previous_snapshot=previous_snapshot,
+            plan=plan,
         ))
 
-    return out
+    return ORJSONResponse(out)
 
 
 @router.get("/sent", response_model=List[PlayerShareDto])
@@ -299,8 +371,13 @@ async def get_sent_shares(
     stmt = (
         select(PlayerShare)
         .options(
-            selectinload(PlayerShare.player).selectinload(Player.current_team),
-            selectinload(PlayerShare.recipient),
+            selectinload(PlayerShare.player)
+            .load_only(*_SHARE_PLAYER_COLUMNS, raiseload=True)
+            .selectinload(Player.current_team)
+            .load_only(Team.team_id, Team.name, raiseload=True),
+            selectinload(PlayerShare.player).selectinload(Player.training_plan),
+            selectinload(PlayerShare.recipient).load_only(User.username, raiseload=True),
+            *STRICT_LOADING,
         )
         .where(PlayerShare.owner_id == current_user.id)
     )
@@ -309,85 +386,27 @@ async def get_sent_shares(
     result = await db.execute(stmt)
     shares = result.scalars().all()
 
-    team_ids = {s.player.current_team_id for s in shares if s.player and s.player.current_team_id}
-    owner_ids = {s.owner_id for s in shares}
-    team_map = {}
-    teams_by_owner = {}
-    teams_by_owner_name = {}
-    if team_ids or owner_ids:
-        team_query = select(Team).where(or_(Team.id.in_(team_ids), Team.coach_id.in_(owner_ids)))
-        team_result = await db.execute(team_query)
-        teams = team_result.scalars().all()
-        team_map = {t.id: t for t in teams}
-        for t in teams:
-            teams_by_owner.setdefault(t.coach_id, []).append(t)
-            teams_by_owner_name[(t.coach_id, t.name)] = t
-    def resolve_owner_team(share: PlayerShare) -> tuple[int | None, str | None]:
-        if share.player.current_team:
-            return share.player.current_team.team_id, share.player.current_team.name
-        if share.player.current_team_id and team_map.get(share.player.current_team_id):
-            team = team_map.get(share.player.current_team_id)
-            return team.team_id, team.name
-        if share.player.team_name and teams_by_owner_name.get((share.owner_id, share.player.team_name)):
-            team = teams_by_owner_name.get((share.owner_id, share.player.team_name))
-            return team.team_id, team.name
-        owner_teams = teams_by_owner.get(share.owner_id, [])
-        if len(owner_teams) == 1:
-            return owner_teams[0].team_id, owner_teams[0].name
-        return None, None
-
-    out: list[PlayerShareDto] = []
-    for share in shares:
-        team_id, team_name = resolve_owner_team(share)
-        latest_snapshot, previous_snapshot = await _get_latest_snapshots(db, share.player.id)
-        plan_targets = None
-        if share.share_plan:
-            plan_result = await db.execute(
-                select(PlayerTrainingPlan).where(PlayerTrainingPlan.player_id == share.player.id)
-            )
-            plan_targets = _plan_to_targets(plan_result.scalar_one_or_none())
-        out.append(PlayerShareDto(
-            share_id=share.id,
-            player=PlayerInShare(
-                id=share.player.id,
-                player_id=share.player.player_id,
-                name=share.player.name,
-                age=share.player.age,
-                potential=share.player.potential or 0,
-                best_position=share.player.best_position,
-                salary=share.player.salary,
-                dmi=share.player.dmi,
-                game_shape=share.player.game_shape,
-                active=share.player.active,
-                jump_shot=share.player.jump_shot,
-                jump_range=share.player.jump_range,
-                outside_defense=share.player.outside_defense,
-                handling=share.player.handling,
-                driving=share.player.driving,
-                passing=share.player.passing,
-                inside_shot=share.player.inside_shot,
-                inside_defense=share.player.inside_defense,
-                rebounding=share.player.rebounding,
-                shot_blocking=share.player.shot_blocking,
-                stamina=share.player.stamina,
-                free_throws=share.player.free_throws,
-                experience=share.player.experience,
-            ),
+    snapshots = await _get_latest_snapshots(db, {s.player_id for s in shares})
+
+    team_map, teams_by_owner, teams_by_owner_name = await _load_owner_teams(db, shares)
+    resolved = [_resolve_owner_team(s, team_map, teams_by_owner, teams_by_owner_name) for s in shares]
+
+    out = []
+    for share, (team_id, team_name) in zip(shares, resolved):
+        latest_snapshot, previous_snapshot = snapshots.get(share.player_id, (None, None))
+        plan = share.player.training_plan if share.share_plan else None
+        out.append(_share_to_dict(
+            share,
             owner_username=current_user.username,
-            owner_name=current_user.username,
-            owner_team_name=team_name,
-            owner_team_id=team_id,
             recipient_username=share.recipient.username,
-            recipient_name=share.recipient.username,
-            shared_at=share.created_at,
-            share_plan=share.share_plan,
-            message=share.message,
-            latest_snapshot=_snapshot_to_dto(latest_snapshot),
-            previous_snapshot=_snapshot_to_dto(previous_snapshot),
-            plan_targets=plan_targets,
+            team_id=team_id,
+            team_name=team_name,
+            latest_snapshot=latest_snapshot,
+            previous_snapshot=previous_snapshot,
+            plan=plan,
         ))
 
-    return out
+    return ORJSONResponse(out)
 
 
 @router.delete("/{share_id}")
@@ -399,17 +418,18 @@ async def remove_share(
     """Remove a share"""
     current_user = await get_current_user_from_cookie(request, db)
 
-    stmt = select(PlayerShare).where(
-        PlayerShare.id == share_id,
-        PlayerShare.owner_id == current_user.id
+    # One DELETE with the ownership check in its WHERE clause; nothing
+    # references a share, so there are no ORM cascades to run
+    stmt = (
+        delete(PlayerShare)
+        .where(PlayerShare.id == share_id, PlayerShare.owner_id == current_user.id)
+        .execution_options(synchronize_session=False)
     )
     result = await db.execute(stmt)
-    share = result.scalar_one_or_none()
 
-    if not share:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Share not found")
 
-    await db.delete(share)
     await db.commit()
 
     return {"success": True, "message": "Share removed"}
@@ -425,22 +445,73 @@ async def update_share(
     """Update share settings (e.g. share_plan toggle). Owner only."""
     current_user = await get_current_user_from_cookie(request, db)
 
-    stmt = select(PlayerShare).where(
-        PlayerShare.id == share_id,
-        PlayerShare.owner_id == current_user.id,
+    # Ownership is part of the WHERE clause, so no share row needs loading;
+    # MySQL reports matched (not changed) rows, so a no-op toggle still counts
+    stmt = (
+        update(PlayerShare)
+        .where(PlayerShare.id == share_id, PlayerShare.owner_id == current_user.id)
+        .values(share_plan=body.share_plan)
+        .execution_options(synchronize_session=False)
     )
     result = await db.execute(stmt)
-    share = result.scalar_one_or_none()
 
-    if not share:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Share not found")
 
-    share.share_plan = body.share_plan
     await db.commit()
 
     return {"success": True}
 
 
+# Built once; every search only binds new values. Only username is selected,
+# so MySQL can answer from ix_users_username alone, walking it in order and
+# stopping once the page is filled. The column collation is case-insensitive,
+# so plain LIKE matches like ILIKE did, without the LOWER() that would rule
+# out the index. An empty query binds "%%", which skips users without a
+# public username.
+_SEARCH_USERNAMES_STMT = (
+    select(User.username)
+    .where(
+        User.id != bindparam("current_user_id"),
+        User.username.like(bindparam("pattern"), escape="/"),
+    )
+    .order_by(User.username.asc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+# The unfiltered first page is what the share dialog requests on focus. It is
+# the same for everyone apart from the caller's own row, so one in-process
+# copy (with room to drop the caller and still detect hasMore) serves all
+# users for a short while.
+FIRST_PAGE_CACHE_TTL = 30  # seconds
+FIRST_PAGE_CACHE_SIZE = 20
+_first_page_cache: tuple[float, list[tuple[UUID, str]]] | None = None
+
+
+async def _get_first_users_page(db: AsyncSession) -> list[tuple[UUID, str]]:
+    global _first_page_cache
+    now = time.monotonic()
+    if _first_page_cache is not None and now - _first_page_cache[0] < FIRST_PAGE_CACHE_TTL:
+        return _first_page_cache[1]
+
+    stmt = (
+        select(User.id, User.username)
+        .where(User.username.isnot(None))
+        .order_by(User.username.asc())
+        .limit(FIRST_PAGE_CACHE_SIZE + 2)
+    )
+    result = await db.execute(stmt)
+    rows = [(row.id, row.username) for row in result]
+    _first_page_cache = (now, rows)
+    return rows
+
+
 @router.get("/users/search", response_model=UserSearchResponse)
 async def search_users(
     request: Request,
@@ -452,23 +523,28 @@ async def search_users(
     """Search for users to share with by public username"""
     current_user = await get_current_user_from_cookie(request, db)
 
-    stmt = select(User).where(User.id != current_user.id)
-
-    if q:
-        stmt = stmt.where(User.username.ilike(f"%{q}%"))
-
-    stmt = stmt.order_by(User.username.asc()).offset(offset).limit(limit + 1)
-
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    if not q and offset == 0 and limit <= FIRST_PAGE_CACHE_SIZE:
+        first_page = await _get_first_users_page(db)
+        usernames = [username for user_id, username in first_page if user_id != current_user.id][:limit + 1]
+    else:
+        result = await db.execute(
+            _SEARCH_USERNAMES_STMT,
+            {
+                "current_user_id": current_user.id,
+                "pattern": f"%{_escape_like(q)}%",
+                "offset": offset,
+                "limit": limit + 1,
+            },
+        )
+        usernames = result.scalars().all()
 
-    has_more = len(users) > limit
-    users = users[:limit]
+    has_more = len(usernames) > limit
+    usernames = usernames[:limit]
 
     return UserSearchResponse(
         users=[
-            UserSearchResult(username=user.username, name=user.username)
-            for user in users
+            UserSearchResult(username=username, name=username)
+            for username in usernames
         ],
         hasMore=has_more,
     )
@@ -16,6 +16,7 @@ from app.models.schedule_match import ScheduleMatch
 from app.models.match_boxscore import MatchBoxscore, MatchTeamBoxscore, MatchPlayerBoxscore
 from app.models.nt_match_boxscore import NTMatchBoxscore, NTMatchTeamBoxscore, NTMatchPlayerBoxscore
 from app.services.bb_api import BBApiClient
+from app.services.roster import upsert_roster
 from app.schemas.team import ScheduleResponse
 from app.routers.user import get_current_user_from_cookie, get_current_team_id_from_cookie, get_current_team_type_from_cookie
 
@@ -50,7 +51,7 @@ async def get_economy(
 ):
     """Get team economy from BuzzerBeater API (matches Spring API)"""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
     team_type = get_current_team_type_from_cookie(request)
     is_utopia = (team_type == "UTOPIA")
 
@@ -70,7 +71,7 @@ async def get_roster(
 ):
     """Get team roster (matches Spring API)"""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
     print(f"DEBUG roster: user={user.username}, team_id={current_team_id}")
 
     # Get team
@@ -129,7 +130,7 @@ async def sync_roster(
 ):
     """Sync roster from BuzzerBeater API (matches Spring API - GET not POST)"""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = teamId or await get_current_team_id_from_cookie(request)
+    current_team_id = teamId or get_current_team_id_from_cookie(request)
 
     if not user.bb_key:
         raise HTTPException(status_code=400, detail="BB key not available")
@@ -149,83 +150,7 @@ async def sync_roster(
     bb_client = BBApiClient(user.bb_key)
     bb_players = await bb_client.get_roster(current_team_id, username=user.login_name, is_utopia=is_utopia)
 
-    # Get current player IDs from BB
-    bb_player_ids = {p["player_id"] for p in bb_players}
-
-    # Mark players not in roster as inactive
-    stmt = select(Player).where(Player.current_team_id == team.id)
-    result = await db.execute(stmt)
-    existing_players = result.scalars().all()
-
-    for player in existing_players:
-        if player.player_id not in bb_player_ids:
-            player.active = False
-
-    # Update or create players
-    synced_count = 0
-    for bb_player in bb_players:
-        stmt = select(Player).where(Player.player_id == bb_player["player_id"])
-        result = await db.execute(stmt)
-        player = result.scalar_one_or_none()
-
-        if player:
-            # Update existing player
-            player.name = bb_player["name"]
-            player.country = bb_player["nationality"]
-            player.age = bb_player["age"]
-            player.height = bb_player["height"]
-            player.potential = bb_player["potential"]
-            player.salary = bb_player["salary"]
-            player.dmi = bb_player["dmi"]
-            player.best_position = bb_player["best_position"]
-            player.game_shape = bb_player["game_shape"]
-            player.jump_shot = bb_player["jump_shot"]
-            player.jump_range = bb_player["jump_range"]
-            player.outside_defense = bb_player["outside_defense"]
-            player.handling = bb_player["handling"]
-            player.driving = bb_player["driving"]
-            player.passing = bb_player["passing"]
-            player.inside_shot = bb_player["inside_shot"]
-            player.inside_defense = bb_player["inside_defense"]
-            player.rebounding = bb_player["rebounding"]
-            player.shot_blocking = bb_player["shot_blocking"]
-            player.stamina = bb_player["stamina"]
-            player.free_throws = bb_player["free_throws"]
-            player.experience = bb_player["experience"]
-            player.current_team_id = team.id
-            player.active = True
-        else:
-            # Create new player
-            player = Player(
-                player_id=bb_player["player_id"],
-                name=bb_player["name"],
-                country=bb_player["nationality"],
-                age=bb_player["age"],
-                height=bb_player["height"],
-                potential=bb_player["potential"],
-                salary=bb_player["salary"],
-                dmi=bb_player["dmi"],
-                best_position=bb_player["best_position"],
-                game_shape=bb_player["game_shape"],
-                jump_shot=bb_player["jump_shot"],
-                jump_range=bb_player["jump_range"],
-                outside_defense=bb_player["outside_defense"],
-                handling=bb_player["handling"],
-                driving=bb_player["driving"],
-                passing=bb_player["passing"],
-                inside_shot=bb_player["inside_shot"],
-                inside_defense=bb_player["inside_defense"],
-                rebounding=bb_player["rebounding"],
-                shot_blocking=bb_player["shot_blocking"],
-                stamina=bb_player["stamina"],
-                free_throws=bb_player["free_throws"],
-                experience=bb_player["experience"],
-                current_team_id=team.id,
-                active=True
-            )
-            db.add(player)
-
-        synced_count += 1
+    synced_count = await upsert_roster(db, team, bb_players)
 
     # Create snapshots for current week
     year, week, _, _ = get_current_bb_week()
@@ -235,72 +160,75 @@ async def sync_roster(
     result = await db.execute(stmt)
     players = result.scalars().all()
 
-    for player in players:
-        # Check if snapshot already exists for this week
-        stmt = select(PlayerSnapshot).where(
-            PlayerSnapshot.player_id == player.id,
-            PlayerSnapshot.year == year,
-            PlayerSnapshot.week_of_year == week
-        )
-        result = await db.execute(stmt)
-        existing_snapshot = result.scalar_one_or_none()
-
-        if existing_snapshot:
-            # Update existing snapshot
-            existing_snapshot.name = player.name
-            existing_snapshot.country = player.country
-            existing_snapshot.age = player.age
-            existing_snapshot.height = player.height
-            existing_snapshot.potential = player.potential
-            existing_snapshot.game_shape = player.game_shape
-            existing_snapshot.salary = player.salary
-            existing_snapshot.dmi = player.dmi
-            existing_snapshot.best_position = player.best_position
-            existing_snapshot.jump_shot = player.jump_shot
-            existing_snapshot.jump_range = player.jump_range
-            existing_snapshot.outside_defense = player.outside_defense
-            existing_snapshot.handling = player.handling
-            existing_snapshot.driving = player.driving
-            existing_snapshot.passing = player.passing
-            existing_snapshot.inside_shot = player.inside_shot
-            existing_snapshot.inside_defense = player.inside_defense
-            existing_snapshot.rebounding = player.rebounding
-            existing_snapshot.shot_blocking = player.shot_blocking
-            existing_snapshot.stamina = player.stamina
-            existing_snapshot.free_throws = player.free_throws
-            existing_snapshot.experience = player.experience
-        else:
-            # Create new snapshot
-            snapshot = PlayerSnapshot(
-                player_id=player.id,
-                bb_player_id=player.player_id,
-                team_id=team.id,
-                year=year,
-                week_of_year=week,
-                name=player.name,
-                country=player.country,
-                age=player.age,
-                height=player.height,
-                potential=player.potential,
-                game_shape=player.game_shape,
-                salary=player.salary,
-                dmi=player.dmi,
-                best_position=player.best_position,
-                jump_shot=player.jump_shot,
-                jump_range=player.jump_range,
-                outside_defense=player.outside_defense,
-                handling=player.handling,
-                driving=player.driving,
-                passing=player.passing,
-                inside_shot=player.inside_shot,
-                inside_defense=player.inside_defense,
-                rebounding=player.rebounding,
-                shot_blocking=player.shot_blocking,
-                stamina=player.stamina,
-                free_throws=player.free_throws,
-                experience=player.experience,
+    # Each lookup below would otherwise flush the snapshots added so far;
+    # leave them pending and write them all in one flush at commit
+    with db.no_autoflush:
+        for player in players:
+            # Check if snapshot already exists for this week
+            stmt = select(PlayerSnapshot).where(
+                PlayerSnapshot.player_id == player.id,
+                PlayerSnapshot.year == year,
+                PlayerSnapshot.week_of_year == week
             )
-            db.add(snapshot)
+            result = await db.execute(stmt)
+            existing_snapshot = result.scalar_one_or_none()
+
+            if existing_snapshot:
+                # Update existing snapshot
+                existing_snapshot.name = player.name
+                existing_snapshot.country = player.country
+                existing_snapshot.age = player.age
+                existing_snapshot.height = player.height
+                existing_snapshot.potential = player.potential
+                existing_snapshot.game_shape = player.game_shape
+                existing_snapshot.salary = player.salary
+                existing_snapshot.dmi = player.dmi
+                existing_snapshot.best_position = player.best_position
+                existing_snapshot.jump_shot = player.jump_shot
+                existing_snapshot.jump_range = player.jump_range
+                existing_snapshot.outside_defense = player.outside_defense
+                existing_snapshot.handling = player.handling
+                existing_snapshot.driving = player.driving
+                existing_snapshot.passing = player.passing
+                existing_snapshot.inside_shot = player.inside_shot
+                existing_snapshot.inside_defense = player.inside_defense
+                existing_snapshot.rebounding = player.rebounding
+                existing_snapshot.shot_blocking = player.shot_blocking
+                existing_snapshot.stamina = player.stamina
+                existing_snapshot.free_throws = player.free_throws
+                existing_snapshot.experience = player.experience
+            else:
+                # Create new snapshot
+                snapshot = PlayerSnapshot(
+                    player_id=player.id,
+                    bb_player_id=player.player_id,
+                    team_id=team.id,
+                    year=year,
+                    week_of_year=week,
+                    name=player.name,
+                    country=player.country,
+                    age=player.age,
+                    height=player.height,
+                    potential=player.potential,
+                    game_shape=player.game_shape,
+                    salary=player.salary,
+                    dmi=player.dmi,
+                    best_position=player.best_position,
+                    jump_shot=player.jump_shot,
+                    jump_range=player.jump_range,
+                    outside_defense=player.outside_defense,
+                    handling=player.handling,
+                    driving=player.driving,
+                    passing=player.passing,
+                    inside_shot=player.inside_shot,
+                    inside_defense=player.inside_defense,
+                    rebounding=player.rebounding,
+                    shot_blocking=player.shot_blocking,
+                    stamina=player.stamina,
+                    free_throws=player.free_throws,
+                    experience=player.experience,
+                )
+                db.add(snapshot)
 
     await db.commit()
 
@@ -694,7 +622,7 @@ async def get_schedule_match_detail(
 ):
     """Get full boxscore details for a single match, cached in DB."""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
     target_team_id = team_id or current_team_id
     is_opponent_request = team_id is not None
     team_type = get_current_team_type_from_cookie(request)
@@ -1079,7 +1007,7 @@ async def get_snapshots(
     db: AsyncSession = Depends(get_db)
 ):
     """Get synced weeks/snapshots for current team"""
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
 
     # Get team
     stmt = select(Team).where(Team.team_id == current_team_id)
@@ -1130,7 +1058,7 @@ async def get_roster_for_week(
     db: AsyncSession = Depends(get_db)
 ):
     """Get roster snapshot for specific week"""
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
 
     # Get team
     stmt = select(Team).where(Team.team_id == current_team_id)
@@ -1143,7 +1071,7 @@ async def get_roster_for_week(
     # Get snapshots for this week
     stmt = (
         select(PlayerSnapshot)
-        .options(selectinload(PlayerSnapshot.player))
+        .options(selectinload(PlayerSnapshot.player).load_only(Player.active, raiseload=True))
         .where(
             PlayerSnapshot.team_id == team.id,
             PlayerSnapshot.year == year,
@@ -1160,7 +1088,7 @@ async def get_roster_for_week(
     # Find archived players (inactive) who have snapshots for this team but not this week
     # Get their most recent snapshot instead
     stmt = (
-        select(Player)
+        select(Player.id)
         .where(
             Player.current_team_id == team.id,
             Player.active == False,
@@ -1168,15 +1096,15 @@ async def get_roster_for_week(
         )
     )
     result = await db.execute(stmt)
-    archived_players = result.scalars().all()
+    archived_player_ids = result.scalars().all()
 
     archived_snapshots = []
-    for player in archived_players:
+    for archived_player_id in archived_player_ids:
         # Get latest snapshot for this player on this team
         stmt = (
             select(PlayerSnapshot)
             .where(
-                PlayerSnapshot.player_id == player.id,
+                PlayerSnapshot.player_id == archived_player_id,
                 PlayerSnapshot.team_id == team.id,
             )
             .order_by(PlayerSnapshot.year.desc(), PlayerSnapshot.week_of_year.desc())
@@ -1188,11 +1116,12 @@ async def get_roster_for_week(
             archived_snapshots.append(last_snapshot)
 
     def _snapshot_to_dict(snapshot, archived, snapshot_label=None):
+        name_parts = snapshot.name.split() if snapshot.name else []
         return {
             "id": str(snapshot.player_id),
             "playerId": snapshot.bb_player_id,
-            "firstName": snapshot.name.split()[0] if snapshot.name else "",
-            "lastName": " ".join(snapshot.name.split()[1:]) if snapshot.name and len(snapshot.name.split()) > 1 else "",
+            "firstName": name_parts[0] if name_parts else "",
+            "lastName": " ".join(name_parts[1:]),
             "name": snapshot.name,
             "country": snapshot.country,
             "age": snapshot.age,
@@ -1242,7 +1171,7 @@ async def get_schedule(
 ):
     """Get team schedule for a season"""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
     team_type = get_current_team_type_from_cookie(request)
     is_utopia = (team_type == "UTOPIA")
 
@@ -8,7 +8,7 @@ from app.database import get_db
 from app.models.user import User
 from app.models.team import Team
 from app.schemas.team import TeamInfo, TeamResponse
-from app.dependencies import get_current_user, get_current_team_id
+from app.dependencies import get_current_user, get_current_user_with_bb_key, get_current_team_id
 from app.services.bb_api import BBApiClient
 
 router = APIRouter()
@@ -59,7 +59,7 @@ async def switch_team(
 
 @router.get("/economy")
 async def get_economy(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_with_bb_key),
     current_team_id: int = Depends(get_current_team_id)
 ):
     """Get team economy from BuzzerBeater API"""
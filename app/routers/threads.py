@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict
@@ -119,7 +119,9 @@ async def _mark_messages_read(db: AsyncSession, thread_id: UUID, current_user_id
             PlayerMessage.sender_id != current_user_id,
             PlayerMessage.read_at.is_(None),
         )
-        .values(read_at=datetime.utcnow())
+        .values(read_at=func.utc_timestamp())
+        # Callers have already rendered their response from the loaded messages
+        .execution_options(synchronize_session=False)
     )
     await db.execute(stmt)
     await db.commit()
@@ -369,7 +371,6 @@ async def create_or_get_thread(
         )
         db.add(thread)
         await db.commit()
-        await db.refresh(thread)
 
         # Reload with relationships
         stmt = (
@@ -466,9 +467,10 @@ async def send_message(
     """Send a message to a thread."""
     current_user = await get_current_user_from_cookie(request, db)
 
-    # Find thread and verify access
+    # Find thread and verify access (the message history isn't needed)
     stmt = (
         select(PlayerThread)
+        .options(raiseload(PlayerThread.messages))
         .where(
             PlayerThread.id == thread_id,
             or_(
@@ -494,11 +496,10 @@ async def send_message(
     )
     db.add(message)
 
-    # Update thread's updated_at
-    thread.updated_at = datetime.utcnow()
+    # Update thread's updated_at; stamped by MySQL in UTC like the Python defaults
+    thread.updated_at = func.utc_timestamp()
 
     await db.commit()
-    await db.refresh(message)
 
     return MessageDto(
         id=message.id,
@@ -1,14 +1,17 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Response, Request, Cookie
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from jose import jwt, JWTError
+import jwt
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr
 
 from app.database import get_db
 from app.config import get_settings
+from app.dependencies import ACCESS_TOKEN_TTL, JWT_ALGORITHM, JWT_ALGORITHMS, SIGNING_KEY
 from app.models.user import User
 from app.models.team import Team, TeamType
 from app.models.season import Season
@@ -27,10 +30,9 @@ class EmailVerificationRequest(BaseModel):
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    # Numeric exp (RFC 7519 NumericDate) skips building a datetime per token
+    ttl = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_TTL
+    return jwt.encode({**data, "exp": int(time.time()) + ttl}, SIGNING_KEY, algorithm=JWT_ALGORITHM)
 
 
 def create_email_verification_token(login_name: str, email: str) -> str:
@@ -43,21 +45,36 @@ def create_email_verification_token(login_name: str, email: str) -> str:
     return create_access_token(payload, expires_delta=expires)
 
 
-async def get_current_user_from_cookie(
-    request: Request,
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current user from session cookie"""
+def _decode_cookie_payload(request: Request) -> dict:
+    """Decode the session cookie once per request and cache it on request.state"""
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is not None:
+        return payload
+
     token = request.cookies.get(TOKEN_COOKIE_NAME)
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        login_name = payload.get("sub")
-        if not login_name:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+        payload = jwt.decode(token, SIGNING_KEY, algorithms=JWT_ALGORITHMS)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    request.state.jwt_payload = payload
+    return payload
+
+
+async def get_current_user_from_cookie(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current user from session cookie (loaded once per request and session)"""
+    user = getattr(request.state, "current_user", None)
+    if user is not None and user in db:
+        return user
+
+    login_name = _decode_cookie_payload(request).get("sub")
+    if not login_name:
         raise HTTPException(status_code=401, detail="Invalid token")
 
     stmt = select(User).where(User.login_name == login_name)
@@ -67,36 +84,25 @@ async def get_current_user_from_cookie(
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
+    request.state.current_user = user
     return user
 
 
-async def get_current_team_id_from_cookie(request: Request) -> int:
+def get_current_team_id_from_cookie(request: Request) -> int:
     """Get current team ID from session cookie"""
-    token = request.cookies.get(TOKEN_COOKIE_NAME)
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        team_id = payload.get("team_id")
-        if not team_id:
-            raise HTTPException(status_code=400, detail="No team selected")
-        return team_id
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    team_id = _decode_cookie_payload(request).get("team_id")
+    if not team_id:
+        raise HTTPException(status_code=400, detail="No team selected")
+    return team_id
 
 
 def get_current_team_type_from_cookie(request: Request) -> str:
     """Get current team type (MAIN or UTOPIA) from session cookie"""
-    token = request.cookies.get(TOKEN_COOKIE_NAME)
-    if not token:
-        return "MAIN"
-
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload.get("team_type", "MAIN")
-    except JWTError:
+        payload = _decode_cookie_payload(request)
+    except HTTPException:
         return "MAIN"
+    return payload.get("team_type", "MAIN")
 
 
 @router.get("/login")
@@ -140,7 +146,6 @@ async def login(
         user.supporter = result.get("supporter", False)
 
     await db.commit()
-    await db.refresh(user)
 
     # Create or update teams
     first_team_id = None
@@ -169,10 +174,11 @@ async def login(
 
     await db.commit()
 
-    # Create JWT token and set as cookie (use login_name for auth)
+    # Create JWT token and set as cookie (use login_name for auth; uid lets the
+    # websocket connect without a user lookup)
     # Include team_type so we know if it's UTOPIA (needs secondteam=1 for BB API)
     access_token = create_access_token(
-        data={"sub": user.login_name, "team_id": first_team_id, "team_type": first_team_type}
+        data={"sub": user.login_name, "uid": str(user.id), "team_id": first_team_id, "team_type": first_team_type}
     )
 
     response.set_cookie(
@@ -239,7 +245,7 @@ async def get_user_teams(
 ):
     """Get all teams for current user (matches Spring API)"""
     user = await get_current_user_from_cookie(request, db)
-    current_team_id = await get_current_team_id_from_cookie(request)
+    current_team_id = get_current_team_id_from_cookie(request)
 
     stmt = select(Team).where(Team.coach_id == user.id)
     result = await db.execute(stmt)
@@ -276,7 +282,7 @@ async def switch_team(
 
     # Create new token with updated team_id and team_type (use login_name for auth)
     access_token = create_access_token(
-        data={"sub": user.login_name, "team_id": teamId, "team_type": team.team_type.value}
+        data={"sub": user.login_name, "uid": str(user.id), "team_id": teamId, "team_type": team.team_type.value}
     )
 
     response.set_cookie(
@@ -377,7 +383,9 @@ async def start_email_verification(
     )
 
     try:
-        email_service.send_email(
+        # send_email blocks (sync HTTP call with retry sleeps); keep it off the event loop
+        await asyncio.to_thread(
+            email_service.send_email,
             to_email=body.email,
             subject="Verify your BB Scout email",
             text_body=text,
@@ -396,8 +404,8 @@ async def verify_email(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError:
+        payload = jwt.decode(token, SIGNING_KEY, algorithms=JWT_ALGORITHMS)
+    except jwt.PyJWTError:
         raise HTTPException(status_code=400, detail="Invalid or expired token")
 
     if payload.get("type") != EMAIL_VERIFY_TOKEN_TYPE:
@@ -5,7 +5,6 @@ Runs every Friday at 1 PM CET (12:00 UTC in winter, 11:00 UTC in summer).
 import asyncio
 import logging
 from datetime import datetime, timedelta
-import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import select
@@ -19,7 +18,8 @@ from app.models.player import Player
 from app.models.player_snapshot import PlayerSnapshot
 from app.models.user_message import UserMessage
 from app.models.user_thread import UserThread
-from app.services.bb_api import BBApiClient
+from app.services.bb_api import BBApiClient, session_client
+from app.services.roster import upsert_roster
 from app.services.email_service import email_service
 from app.config import get_settings
 
@@ -50,73 +50,76 @@ async def create_player_snapshots(team: Team, db: AsyncSession) -> int:
     players = result.scalars().all()
 
     snapshots_created = 0
-    for player in players:
-        # Check if snapshot already exists for this week
-        stmt = select(PlayerSnapshot).where(
-            PlayerSnapshot.player_id == player.id,
-            PlayerSnapshot.year == year,
-            PlayerSnapshot.week_of_year == week
-        )
-        result = await db.execute(stmt)
-        existing_snapshot = result.scalar_one_or_none()
-
-        if existing_snapshot:
-            # Update existing snapshot
-            existing_snapshot.name = player.name
-            existing_snapshot.country = player.country
-            existing_snapshot.age = player.age
-            existing_snapshot.height = player.height
-            existing_snapshot.potential = player.potential
-            existing_snapshot.game_shape = player.game_shape
-            existing_snapshot.salary = player.salary
-            existing_snapshot.dmi = player.dmi
-            existing_snapshot.best_position = player.best_position
-            existing_snapshot.jump_shot = player.jump_shot
-            existing_snapshot.jump_range = player.jump_range
-            existing_snapshot.outside_defense = player.outside_defense
-            existing_snapshot.handling = player.handling
-            existing_snapshot.driving = player.driving
-            existing_snapshot.passing = player.passing
-            existing_snapshot.inside_shot = player.inside_shot
-            existing_snapshot.inside_defense = player.inside_defense
-            existing_snapshot.rebounding = player.rebounding
-            existing_snapshot.shot_blocking = player.shot_blocking
-            existing_snapshot.stamina = player.stamina
-            existing_snapshot.free_throws = player.free_throws
-            existing_snapshot.experience = player.experience
-        else:
-            # Create new snapshot
-            snapshot = PlayerSnapshot(
-                player_id=player.id,
-                bb_player_id=player.player_id,
-                team_id=team.id,
-                year=year,
-                week_of_year=week,
-                name=player.name,
-                country=player.country,
-                age=player.age,
-                height=player.height,
-                potential=player.potential,
-                game_shape=player.game_shape,
-                salary=player.salary,
-                dmi=player.dmi,
-                best_position=player.best_position,
-                jump_shot=player.jump_shot,
-                jump_range=player.jump_range,
-                outside_defense=player.outside_defense,
-                handling=player.handling,
-                driving=player.driving,
-                passing=player.passing,
-                inside_shot=player.inside_shot,
-                inside_defense=player.inside_defense,
-                rebounding=player.rebounding,
-                shot_blocking=player.shot_blocking,
-                stamina=player.stamina,
-                free_throws=player.free_throws,
-                experience=player.experience,
+    # Each lookup below would otherwise flush the snapshots added so far;
+    # leave them pending and write them all in one flush at commit
+    with db.no_autoflush:
+        for player in players:
+            # Check if snapshot already exists for this week
+            stmt = select(PlayerSnapshot).where(
+                PlayerSnapshot.player_id == player.id,
+                PlayerSnapshot.year == year,
+                PlayerSnapshot.week_of_year == week
             )
-            db.add(snapshot)
-            snapshots_created += 1
+            result = await db.execute(stmt)
+            existing_snapshot = result.scalar_one_or_none()
+
+            if existing_snapshot:
+                # Update existing snapshot
+                existing_snapshot.name = player.name
+                existing_snapshot.country = player.country
+                existing_snapshot.age = player.age
+                existing_snapshot.height = player.height
+                existing_snapshot.potential = player.potential
+                existing_snapshot.game_shape = player.game_shape
+                existing_snapshot.salary = player.salary
+                existing_snapshot.dmi = player.dmi
+                existing_snapshot.best_position = player.best_position
+                existing_snapshot.jump_shot = player.jump_shot
+                existing_snapshot.jump_range = player.jump_range
+                existing_snapshot.outside_defense = player.outside_defense
+                existing_snapshot.handling = player.handling
+                existing_snapshot.driving = player.driving
+                existing_snapshot.passing = player.passing
+                existing_snapshot.inside_shot = player.inside_shot
+                existing_snapshot.inside_defense = player.inside_defense
+                existing_snapshot.rebounding = player.rebounding
+                existing_snapshot.shot_blocking = player.shot_blocking
+                existing_snapshot.stamina = player.stamina
+                existing_snapshot.free_throws = player.free_throws
+                existing_snapshot.experience = player.experience
+            else:
+                # Create new snapshot
+                snapshot = PlayerSnapshot(
+                    player_id=player.id,
+                    bb_player_id=player.player_id,
+                    team_id=team.id,
+                    year=year,
+                    week_of_year=week,
+                    name=player.name,
+                    country=player.country,
+                    age=player.age,
+                    height=player.height,
+                    potential=player.potential,
+                    game_shape=player.game_shape,
+                    salary=player.salary,
+                    dmi=player.dmi,
+                    best_position=player.best_position,
+                    jump_shot=player.jump_shot,
+                    jump_range=player.jump_range,
+                    outside_defense=player.outside_defense,
+                    handling=player.handling,
+                    driving=player.driving,
+                    passing=player.passing,
+                    inside_shot=player.inside_shot,
+                    inside_defense=player.inside_defense,
+                    rebounding=player.rebounding,
+                    shot_blocking=player.shot_blocking,
+                    stamina=player.stamina,
+                    free_throws=player.free_throws,
+                    experience=player.experience,
+                )
+                db.add(snapshot)
+                snapshots_created += 1
 
     return snapshots_created
 
@@ -142,83 +145,7 @@ async def sync_roster_for_team(user: User, team: Team, db: AsyncSession, http_cl
             logger.warning(f"No players returned for team {team.name} (ID: {team.team_id})")
             return 0
 
-        # Get current player IDs from BB
-        bb_player_ids = {p["player_id"] for p in bb_players}
-
-        # Mark players not in roster as inactive
-        stmt = select(Player).where(Player.current_team_id == team.id)
-        result = await db.execute(stmt)
-        existing_players = result.scalars().all()
-
-        for player in existing_players:
-            if player.player_id not in bb_player_ids:
-                player.active = False
-
-        # Update or create players
-        synced_count = 0
-        for bb_player in bb_players:
-            stmt = select(Player).where(Player.player_id == bb_player["player_id"])
-            result = await db.execute(stmt)
-            player = result.scalar_one_or_none()
-
-            if player:
-                # Update existing player
-                player.name = bb_player["name"]
-                player.country = bb_player["nationality"]
-                player.age = bb_player["age"]
-                player.height = bb_player["height"]
-                player.potential = bb_player["potential"]
-                player.salary = bb_player["salary"]
-                player.dmi = bb_player["dmi"]
-                player.best_position = bb_player["best_position"]
-                player.game_shape = bb_player["game_shape"]
-                player.jump_shot = bb_player["jump_shot"]
-                player.jump_range = bb_player["jump_range"]
-                player.outside_defense = bb_player["outside_defense"]
-                player.handling = bb_player["handling"]
-                player.driving = bb_player["driving"]
-                player.passing = bb_player["passing"]
-                player.inside_shot = bb_player["inside_shot"]
-                player.inside_defense = bb_player["inside_defense"]
-                player.rebounding = bb_player["rebounding"]
-                player.shot_blocking = bb_player["shot_blocking"]
-                player.stamina = bb_player["stamina"]
-                player.free_throws = bb_player["free_throws"]
-                player.experience = bb_player["experience"]
-                player.current_team_id = team.id
-                player.active = True
-            else:
-                # Create new player
-                player = Player(
-                    player_id=bb_player["player_id"],
-                    name=bb_player["name"],
-                    country=bb_player["nationality"],
-                    age=bb_player["age"],
-                    height=bb_player["height"],
-                    potential=bb_player["potential"],
-                    salary=bb_player["salary"],
-                    dmi=bb_player["dmi"],
-                    best_position=bb_player["best_position"],
-                    game_shape=bb_player["game_shape"],
-                    jump_shot=bb_player["jump_shot"],
-                    jump_range=bb_player["jump_range"],
-                    outside_defense=bb_player["outside_defense"],
-                    handling=bb_player["handling"],
-                    driving=bb_player["driving"],
-                    passing=bb_player["passing"],
-                    inside_shot=bb_player["inside_shot"],
-                    inside_defense=bb_player["inside_defense"],
-                    rebounding=bb_player["rebounding"],
-                    shot_blocking=bb_player["shot_blocking"],
-                    stamina=bb_player["stamina"],
-                    free_throws=bb_player["free_throws"],
-                    experience=bb_player["experience"],
-                    current_team_id=team.id,
-                    active=True
-                )
-                db.add(player)
-
-            synced_count += 1
+        synced_count = await upsert_roster(db, team, bb_players)
 
         return synced_count
 
@@ -247,7 +174,7 @@ async def sync_user_rosters(user: User, semaphore: asyncio.Semaphore) -> tuple[i
                 players_synced = 0
 
                 # Use single HTTP client per user to maintain session
-                async with httpx.AsyncClient() as http_client:
+                async with session_client() as http_client:
                     bb_client = BBApiClient(user.bb_key)
 
                     # Login first
@@ -359,19 +286,21 @@ async def send_unread_message_reminders():
     sent_count = 0
 
     async with async_session() as db:
+        # Cooldown filter runs in SQL so ix_users_unread_reminder_scan can serve it
+        cooldown_cutoff = datetime.utcnow() - timedelta(hours=24)
         stmt = select(User).where(
             User.unread_reminder_enabled == True,
             User.email_verified == True,
+            or_(
+                User.last_unread_reminder_sent_at.is_(None),
+                User.last_unread_reminder_sent_at <= cooldown_cutoff,
+            ),
             User.email.isnot(None),
         )
         result = await db.execute(stmt)
         users = result.scalars().all()
 
         for user in users:
-            if user.last_unread_reminder_sent_at:
-                if user.last_unread_reminder_sent_at > datetime.utcnow() - timedelta(hours=24):
-                    continue
-
             unread_count = await get_unread_dm_count_for_user(user, db)
             if unread_count <= 0:
                 continue
@@ -6,6 +6,37 @@ from app.config import get_settings
 settings = get_settings()
 
 
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """Connection pool shared by every BB API client; closed once at shutdown."""
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+# Keep-alive connections are reused across requests. Each BB session still
+# gets its own AsyncClient (and cookie jar) on top, so login cookies never
+# leak between users.
+_transport = _SharedTransport(
+    verify=settings.bb_api_verify_ssl,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+
+def session_client() -> httpx.AsyncClient:
+    """New HTTP client with its own cookies, backed by the shared connection pool"""
+    return httpx.AsyncClient(transport=_transport)
+
+
+async def close_transport() -> None:
+    await _transport.close_pool()
+
+
 class BBApiClient:
     """Client for BuzzerBeater API (XML-based)"""
 
@@ -18,7 +49,7 @@ class BBApiClient:
 
     async def login(self, username: str, password: str) -> Dict[str, Any]:
         """Login to BuzzerBeater and get access key"""
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             # Step 1: Verify login credentials
             response = await client.get(
                 f"{self.base_url}/login.aspx",
@@ -150,7 +181,7 @@ class BBApiClient:
         if not self.bb_key:
             raise ValueError("BB key required for this operation")
 
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             # First establish session by calling login
             # For UTOPIA teams, include secondteam=1 to authenticate for that team
             if username:
@@ -219,7 +250,7 @@ class BBApiClient:
         if not self.bb_key:
             raise ValueError("BB key required for this operation")
 
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             response = await client.get(
                 f"{self.base_url}/teaminfo.aspx",
                 params={"accessKey": self.bb_key, "teamid": team_id}
@@ -288,7 +319,7 @@ class BBApiClient:
         if not self.bb_key:
             raise ValueError("BB key required for this operation")
 
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             # First establish session by calling login
             # For UTOPIA teams, include secondteam=1 to authenticate for that team
             if username:
@@ -368,7 +399,7 @@ class BBApiClient:
         if not self.bb_key:
             raise ValueError("BB key required for this operation")
 
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             # First establish session by calling login
             # For UTOPIA teams, include secondteam=1 to authenticate for that team
             if username:
@@ -442,7 +473,7 @@ class BBApiClient:
         if not self.bb_key and username:
             raise ValueError("BB key required for this operation")
 
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             if username and self.bb_key:
                 login_params = {"login": username, "code": self.bb_key}
                 if is_utopia:
@@ -656,7 +687,7 @@ class BBApiClient:
             return []
 
         print(f"DEBUG get_seasons: calling BB API /seasons.aspx")
-        async with httpx.AsyncClient(verify=settings.bb_api_verify_ssl) as client:
+        async with session_client() as client:
             # BB endpoints in this app typically require login session first.
             if username:
                 login_params = {"login": username, "code": self.bb_key}
@@ -0,0 +1,68 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.player import Player
+from app.models.team import Team
+
+# BB roster field -> player column, for fields that are stored as-is
+PLAYER_FIELDS = {
+    "name": "name",
+    "nationality": "country",
+    "age": "age",
+    "height": "height",
+    "potential": "potential",
+    "salary": "salary",
+    "dmi": "dmi",
+    "best_position": "best_position",
+    "game_shape": "game_shape",
+    "jump_shot": "jump_shot",
+    "jump_range": "jump_range",
+    "outside_defense": "outside_defense",
+    "handling": "handling",
+    "driving": "driving",
+    "passing": "passing",
+    "inside_shot": "inside_shot",
+    "inside_defense": "inside_defense",
+    "rebounding": "rebounding",
+    "shot_blocking": "shot_blocking",
+    "stamina": "stamina",
+    "free_throws": "free_throws",
+    "experience": "experience",
+}
+
+
+async def upsert_roster(db: AsyncSession, team: Team, bb_players: List[Dict[str, Any]]) -> int:
+    """Write a BB roster to the player table. Returns number of players synced."""
+    bb_player_ids = {p["player_id"] for p in bb_players}
+
+    # Mark players not in roster as inactive
+    await db.execute(
+        update(Player)
+        .where(Player.current_team_id == team.id, Player.player_id.notin_(bb_player_ids))
+        .values(active=False)
+    )
+
+    if not bb_players:
+        return 0
+
+    # Update or create players in one statement; player_id is unique, so
+    # known players are updated in place and new ones are inserted
+    stmt = mysql_insert(Player).values([
+        {
+            "player_id": bb_player["player_id"],
+            **{column: bb_player[field] for field, column in PLAYER_FIELDS.items()},
+            "current_team_id": team.id,
+            "active": True,
+        }
+        for bb_player in bb_players
+    ])
+    stmt = stmt.on_duplicate_key_update({
+        column: stmt.inserted[column]
+        for column in (*PLAYER_FIELDS.values(), "current_team_id", "active")
+    })
+    await db.execute(stmt)
+
+    return len(bb_players)
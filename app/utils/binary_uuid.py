@@ -0,0 +1,32 @@
+import uuid
+
+from sqlalchemy import Uuid
+from sqlalchemy.dialects.mysql import BINARY
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUuid(TypeDecorator):
+    """UUID stored as BINARY(16) on MySQL instead of CHAR(32).
+
+    Halves the size of every primary key and foreign key index entry. Other
+    dialects fall back to the regular Uuid type.
+    """
+    impl = Uuid
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(BINARY(16))
+        return dialect.type_descriptor(Uuid())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "mysql":
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name != "mysql":
+            return value
+        return uuid.UUID(bytes=value)
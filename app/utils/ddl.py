@@ -0,0 +1,66 @@
+"""DDL helpers for Alembic migrations."""
+import sqlalchemy as sa
+from alembic import context, op
+
+# MySQL online DDL hints, tried in order. INSTANT (8.0.12+) is metadata-only;
+# INPLACE/LOCK=NONE avoids a blocking table copy where INSTANT is unsupported.
+ONLINE_DDL_HINTS = ("ALGORITHM=INSTANT", "ALGORITHM=INPLACE, LOCK=NONE")
+
+# ER_ALTER_OPERATION_NOT_SUPPORTED and ER_ALTER_OPERATION_NOT_SUPPORTED_REASON:
+# the server cannot honour the requested algorithm or lock
+ALGORITHM_NOT_SUPPORTED_ERRORS = (1845, 1846)
+
+
+def alter_table_online(table: str, clauses: str) -> None:
+    """Run ALTER TABLE with the cheapest MySQL algorithm the server accepts.
+
+    Falls back to a plain ALTER TABLE on other dialects, in offline mode or
+    when the server rejects every hint as unsupported. Any other error is
+    raised as is.
+    """
+    statement = f"ALTER TABLE {table} {clauses}"
+    if op.get_context().dialect.name != "mysql" or context.is_offline_mode():
+        op.execute(statement)
+        return
+
+    conn = op.get_bind()
+    for hint in ONLINE_DDL_HINTS:
+        try:
+            conn.execute(sa.text(f"{statement}, {hint}"))
+            return
+        except sa.exc.DBAPIError as e:
+            # MySQL rejects unsupported algorithms before touching the table;
+            # any other failure is a real error in the statement itself
+            if e.orig is None or not e.orig.args or e.orig.args[0] not in ALGORITHM_NOT_SUPPORTED_ERRORS:
+                raise
+            continue
+    op.execute(statement)
+
+
+def drop_indexes_for_bulk_update(table: str, columns: list[str]) -> list[dict]:
+    """Drop the indexes on any of columns ahead of a bulk rewrite of those columns.
+
+    Rebuilding an index once after the rewrite is cheaper than maintaining it
+    row by row. Pass the result to recreate_indexes() afterwards. Indexes a
+    foreign key depends on cannot be dropped on MySQL, so keep FK columns out
+    of columns. Returns an empty list in offline mode, where there is no
+    database to inspect.
+    """
+    if context.is_offline_mode():
+        return []
+
+    targets = set(columns)
+    dropped = [
+        index
+        for index in sa.inspect(op.get_bind()).get_indexes(table)
+        if targets.intersection(index["column_names"])
+    ]
+    for index in dropped:
+        op.drop_index(index["name"], table_name=table)
+    return dropped
+
+
+def recreate_indexes(table: str, indexes: list[dict]) -> None:
+    """Recreate indexes returned by drop_indexes_for_bulk_update()."""
+    for index in indexes:
+        op.create_index(index["name"], table, index["column_names"], unique=index["unique"])
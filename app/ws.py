@@ -1,9 +1,10 @@
 from typing import Dict, Set, Optional, Any
 from fastapi import WebSocket
 import asyncio
-import json
 import logging
 
+import orjson
+
 try:
     import redis.asyncio as aioredis
 except Exception:
@@ -38,10 +39,13 @@ class ConnectionManager:
         conns = self.active_connections.get(user_id)
         if not conns:
             return
+        # Serialized once for every socket; orjson handles UUIDs and datetimes
+        # natively. Sent as a text frame, which is what the client parses.
+        text = orjson.dumps(data).decode()
         to_remove = []
         for ws in list(conns):
             try:
-                await ws.send_json(data)
+                await ws.send_text(text)
             except Exception:
                 to_remove.append(ws)
         if to_remove:
@@ -56,10 +60,41 @@ class ConnectionManager:
         if not manager.redis:
             return
         try:
-            await manager.redis.publish(channel, json.dumps(message))
+            await manager.redis.publish(channel, orjson.dumps(message))
         except Exception:
             logging.exception("Failed to publish to redis")
 
+    async def cache_get(self, key: str) -> Optional[bytes]:
+        """Read a cached value from Redis; None on miss or when Redis is unavailable."""
+        if not manager.redis:
+            return None
+        try:
+            return await manager.redis.get(key)
+        except Exception:
+            logging.exception("Failed to read cache key %s", key)
+            return None
+
+    async def cache_set(self, key: str, value: bytes, ttl: int) -> None:
+        if not manager.redis:
+            return
+        try:
+            await manager.redis.set(key, value, ex=ttl)
+        except Exception:
+            logging.exception("Failed to write cache key %s", key)
+
+    async def cache_delete(self, *keys: str) -> None:
+        if not manager.redis or not keys:
+            return
+        try:
+            await manager.redis.delete(*keys)
+        except Exception:
+            logging.exception("Failed to delete cache keys %s", keys)
+
+
+def dm_threads_cache_key(user_id) -> str:
+    """Redis key for a user's cached DM thread list (GET /dm)."""
+    return f"dm:threads:{user_id}"
+
 
 async def _redis_listener(redis_client, channel_name: str):
     pubsub = redis_client.pubsub()
@@ -69,7 +104,7 @@ async def _redis_listener(redis_client, channel_name: str):
             continue
         if item['type'] == 'message':
             try:
-                data = json.loads(item['data'])
+                data = orjson.loads(item['data'])
                 # Expect data to have 'target_user_id' and payload
                 target = data.get('target_user_id')
                 payload = data.get('payload')
@@ -24,4 +24,4 @@ supercronic "$CRON_FILE" &
 
 alembic upgrade head
 
-exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8080}"
\ No newline at end of file
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8080}" --loop uvloop --http httptools
\ No newline at end of file